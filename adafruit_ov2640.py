@@ -40,7 +40,7 @@ from adafruit_bus_device.i2c_device import I2CDevice
 from micropython import const
 
 try:
-    from typing import List, Optional, Type, Union
+    from typing import Callable, List, Optional, Sequence, Tuple, Type, Union
 
     from busio import I2C
     from circuitpython_typing import WriteableBuffer
@@ -114,6 +114,18 @@ _R_BYPASS_DSP_BYPAS = const(0x01)
 OV2640_COLOR_RGB = 0
 OV2640_COLOR_YUV = 1
 OV2640_COLOR_JPEG = 2
+OV2640_COLOR_RAW = 3
+
+OV2640_BYTE_ORDER_BIG_ENDIAN = 0
+OV2640_BYTE_ORDER_LITTLE_ENDIAN = 1
+
+OV2640_EFFECT_NONE = 0
+OV2640_EFFECT_NEGATIVE = 1
+OV2640_EFFECT_GRAYSCALE = 2
+OV2640_EFFECT_RED = 3
+OV2640_EFFECT_GREEN = 4
+OV2640_EFFECT_BLUE = 5
+OV2640_EFFECT_SEPIA = 6
 
 _IMAGE_MODE_Y8_DVP_EN = const(0x40)
 _IMAGE_MODE_JPEG_EN = const(0x10)
@@ -144,6 +156,8 @@ _MC_BIST_LAUNCH = const(0x01)
 _BANK_DSP = const(0)
 _BANK_SENSOR = const(1)
 
+_OV2640_PID = const(0x26)
+
 # Sensor register bank FF=0x01
 _GAIN = const(0x00)
 _COM1 = const(0x03)
@@ -246,6 +260,28 @@ _COM10_HSYNC_NEG = const(0x01)  # HSYNC negative
 
 _CTRL1_AWB = const(0x08)  # Enable AWB
 
+# Special digital effect (SDE) registers, accessed through BPADDR/BPDATA
+_SDE_CTRL = const(0x00)
+_SDE_SATURATION = const(0x03)  # U, V saturation
+_SDE_FIXED_UV = const(0x05)  # U, V values for the fixed-color effects
+_SDE_CONTRAST = const(0x07)  # Y gain reference, contrast gain, offset, sign
+
+_SDE_CTRL_NEGATIVE = const(0x40)
+_SDE_CTRL_FIXED_UV = const(0x18)
+_SDE_CTRL_CONTRAST = const(0x04)
+_SDE_CTRL_SATURATION = const(0x02)
+
+# Per OV2640_EFFECT_ constant: SDE control bits, fixed U and fixed V
+_sde_effects = (
+    (0x00, 0x80, 0x80),
+    (_SDE_CTRL_NEGATIVE, 0x80, 0x80),
+    (_SDE_CTRL_FIXED_UV, 0x80, 0x80),
+    (_SDE_CTRL_FIXED_UV, 0x40, 0xC0),
+    (_SDE_CTRL_FIXED_UV, 0x40, 0x40),
+    (_SDE_CTRL_FIXED_UV, 0xA0, 0x40),
+    (_SDE_CTRL_FIXED_UV, 0x40, 0xA6),
+)
+
 _VV_AGC_TH_SET = lambda h, l: (h << 4) | (l & 0x0F)
 
 _REG32_UXGA = const(0x36)
@@ -257,10 +293,35 @@ _CLKRC_2X_UXGA = const(0x01 | _CLKRC_2X)
 _CLKRC_2X_SVGA = _CLKRC_2X
 _CLKRC_2X_CIF = _CLKRC_2X
 
+# Registers that are not tracked by the driver, saved by snapshot() and
+# rewritten by reset()
+_SNAPSHOT_REGISTERS = (
+    (_BANK_SENSOR, _COM9),
+    (_BANK_DSP, _CTRL3),
+    (_BANK_DSP, _CTRL1),
+)
+
+# Registers with settings the driver tracks in its register cache, such as
+# auto_exposure and auto_white_balance, rewritten by reset() from the cache
+_CACHED_RESET_REGISTERS = (
+    (_BANK_SENSOR, _COM8),
+    (_BANK_DSP, _CTRL1),
+)
+
+# The registers holding AEC[9:2], AEC[1:0] and AEC[15:10]
+_exposure_registers = bytes((_AEC, _REG04, _REG45))
+# The registers read by OV2640.meter(), starting with the exposure registers
+_metering_registers = bytes((_AEC, _REG04, _REG45, _YAVG, _GAIN))
+
 _OV2640_MODE_CIF = const(0)
 _OV2640_MODE_SVGA = const(1)
 _OV2640_MODE_UXGA = const(2)
 
+# Per sensor mode: the number of lines in 10ms at CLKRC divider 1 (the BD50
+# banding values in the _ov2640_settings_to_* tables) and in a whole frame
+_mode_lines_per_10ms = (0xCA, 0xCA, 0xBB)
+_mode_frame_lines = (336, 672, 1248)
+
 OV2640_SIZE_96X96 = 0  # 96x96
 OV2640_SIZE_QQVGA = 1  # 160x120
 OV2640_SIZE_QCIF = 2  # 176x144
@@ -957,9 +1018,295 @@ _ov2640_color_settings = {
             0x00,
         ]
     ),
+    # 8 bits per pixel Bayer data: the top 8 bits of RAW10 on an 8-bit bus
+    OV2640_COLOR_RAW: bytes(
+        [
+            _BANK_SEL,
+            _BANK_DSP,
+            _RESET,
+            _RESET_DVP,
+            _IMAGE_MODE,
+            _IMAGE_MODE_RAW10,
+            0xD7,
+            0x03,
+            0xE1,
+            0x77,
+            _RESET,
+            0x00,
+        ]
+    ),
 }
 
 
+def _window_for_size(size: int) -> Tuple[int, int, int, int, int, int, int]:
+    width, height, ratio = _resolution_info[size]
+    offset_x, offset_y, max_x, max_y = _ratio_table[ratio]
+    mode = _OV2640_MODE_UXGA
+    if size <= OV2640_SIZE_CIF:
+        mode = _OV2640_MODE_CIF
+        max_x //= 4
+        max_y //= 4
+        offset_x //= 4
+        offset_y //= 4
+        max_y = min(max_y, 296)
+
+    elif size <= OV2640_SIZE_SVGA:
+        mode = _OV2640_MODE_SVGA
+        max_x //= 2
+        max_y //= 2
+        offset_x //= 2
+        offset_y //= 2
+
+    return mode, offset_x, offset_y, max_x, max_y, width, height
+
+
+def _window_registers(
+    offset_x: int, offset_y: int, max_x: int, max_y: int, width: int, height: int
+) -> List[int]:
+    max_x //= 4
+    max_y //= 4
+    width //= 4
+    height //= 4
+
+    return [
+        _BANK_SEL,
+        _BANK_DSP,
+        _HSIZE,
+        max_x & 0xFF,
+        _VSIZE,
+        max_y & 0xFF,
+        _XOFFL,
+        offset_x & 0xFF,
+        _YOFFL,
+        offset_y & 0xFF,
+        _VHYX,
+        ((max_y >> 1) & 0x80)
+        | ((offset_y >> 4) & 0x70)
+        | ((max_x >> 5) & 0x08)
+        | ((offset_x >> 8) & 0x07),
+        _TEST,
+        (max_x >> 2) & 0x80,
+        _ZMOW,
+        (width) & 0xFF,
+        _ZMOH,
+        (height) & 0xFF,
+        _ZMHH,
+        ((height >> 6) & 0x04) | ((width >> 8) & 0x03),
+    ]
+
+
+def _band_height(max_rows: int, height: int, max_y: int, row_bytes: int) -> int:
+    # The DSP window and output sizes are programmed in units of 4 rows, so a
+    # band must be a multiple of 4 rows both on the sensor and in the output
+    for rows in range(max_rows - max_rows % 4, 0, -4):
+        if height % rows == 0 and (rows * max_y) % (height * 4) == 0:
+            return rows
+    for rows in range(4, height + 1, 4):
+        if height % rows == 0 and (rows * max_y) % (height * 4) == 0:
+            break
+    raise ValueError(
+        f"Buffer is too small for a single band, which at this size is {rows} rows, "
+        f"{rows * row_bytes} bytes"
+    )
+
+
+def _gain_from_register(value: int) -> int:
+    # Each of bits 7:4 doubles the gain, bits 3:0 add sixteenths
+    gain = 16 + (value & 0x0F)
+    for bit in (0x10, 0x20, 0x40, 0x80):
+        if value & bit:
+            gain *= 2
+    return gain
+
+
+def _gain_to_register(gain: int) -> int:
+    # The inverse of _gain_from_register, for a gain in sixteenths, rounded to
+    # the nearest gain the register can hold
+    value = 0
+    shift = 0
+    for bit in (0x10, 0x20, 0x40, 0x80):
+        if (gain + (1 << shift >> 1)) >> shift < 32:
+            break
+        shift += 1
+        value |= bit
+    return value | min(max(((gain + (1 << shift >> 1)) >> shift) - 16, 0), 0x0F)
+
+
+def _capture_buffer_size(size: int, colorspace: int) -> int:
+    width, height, _ = _resolution_info[size]
+    if colorspace == OV2640_COLOR_JPEG:
+        return width * height // 5
+    if colorspace == OV2640_COLOR_RAW:
+        return width * height
+    return width * height * 2
+
+
+class CaptureTimeoutError(RuntimeError):
+    """Raised when the camera cannot be made ready to capture before the deadline"""
+
+
+class Metering:
+    """Exposure statistics computed by the sensor, as read by `OV2640.meter`"""
+
+    __slots__ = ("exposure", "gain", "luminance")
+
+    def __init__(self) -> None:
+        self.luminance = 0
+        """The average luminance of the last frame (``YAVG``), from 0 to 255"""
+        self.exposure = 0
+        """The exposure time, in lines"""
+        self.gain = 1.0
+        """The analog gain, from 1 to 31"""
+
+
+class ExposureController:
+    """A software automatic exposure loop, driven by the luminance the sensor
+    measures for each frame.
+
+    The sensor's own AEC and AGC are turned off; on each `update` the exposure
+    and gain are moved towards the values that bring the average luminance to
+    ``target``, and written in a single bus transaction.  Assign the controller
+    to `OV2640.exposure_controller` to have it updated after every captured frame.
+
+    Args:
+        camera (OV2640): The camera to control.
+        target (int): The average luminance to aim for, from 0 to 255.
+        damping (float): The fraction of the remaining correction applied each \
+            frame, from 0 (none) to 1 (all of it at once).
+        tolerance (int): The luminance error that counts as converged.
+        min_exposure (int): The shortest exposure to use, in lines.
+        max_exposure (Optional[int]): The longest exposure to use, in lines, or \
+            None for one frame in the current sensor mode.
+        max_gain (float): The highest analog gain to use, up to 31.
+    """
+
+    def __init__(
+        self,
+        camera: "OV2640",
+        target: int = 96,
+        damping: float = 0.75,
+        tolerance: int = 4,
+        min_exposure: int = 1,
+        max_exposure: Optional[int] = None,
+        max_gain: float = 8.0,
+    ) -> None:
+        self._camera = camera
+        self.target = target
+        self.damping = damping
+        self.tolerance = tolerance
+        self.min_exposure = min_exposure
+        self.max_exposure = max_exposure
+        self.max_gain = max_gain
+        self._metering = Metering()
+        self._frames = 0
+        self._converged = False
+        self._convergence_frames = None
+        camera.auto_exposure = False
+        camera.auto_gain = False
+
+    @property
+    def converged(self) -> bool:
+        """True if the luminance was within tolerance of the target at the last update"""
+        return self._converged
+
+    @property
+    def convergence_frames(self) -> Optional[int]:
+        """The number of frames the last convergence took, or None if the
+        controller has not converged yet"""
+        return self._convergence_frames
+
+    def update(self) -> bool:
+        """Meter the last frame and correct the exposure, returning `converged`"""
+        camera = self._camera
+        metering = camera.meter(self._metering)
+        if camera.frames_since_reconfiguration <= 1:
+            # The mode has changed, so time convergence afresh
+            self._frames = 0
+            self._converged = False
+        self._frames += 1
+
+        luminance = metering.luminance
+        if abs(self.target - luminance) <= self.tolerance:
+            if not self._converged:
+                self._converged = True
+                self._convergence_frames = self._frames
+            return True
+        if self._converged:
+            self._converged = False
+            self._frames = 1
+
+        # Luminance is roughly proportional to exposure times gain
+        ratio = self.target / max(luminance, 1)
+        ratio = 1 + self.damping * (ratio - 1)
+        total = metering.exposure * metering.gain * 16 * ratio
+        max_exposure = self.max_exposure or _mode_frame_lines[camera._mode]
+        exposure = round(min(max(total / 16, self.min_exposure), max_exposure))
+        gain = round(min(max(total / exposure, 16), self.max_gain * 16))
+        camera._write_exposure(exposure, gain)
+        return False
+
+
+class FrameBufferPool:
+    """A capture buffer that is allocated once, large enough for the largest of
+    several modes, and handed out as correctly sized slices.
+
+    Allocating a fresh capture buffer for every still fragments the heap when a
+    preview bitmap stays alive, and eventually fails with `MemoryError`.  Create
+    the pool at startup (usually via `OV2640.allocate_buffer_pool`) so that
+    steady-state capture allocates nothing.
+
+    Args:
+        modes (Sequence[Tuple[int, int]]): The ``(size, colorspace)`` pairs that \
+            the pool must be able to hold, using the ``OV2640_SIZE_`` and \
+            ``OV2640_COLOR_`` constants.
+    """
+
+    def __init__(self, modes: Sequence[Tuple[int, int]]) -> None:
+        capacity = 0
+        for size, colorspace in modes:
+            capacity = max(capacity, _capture_buffer_size(size, colorspace))
+        if not capacity:
+            raise ValueError("At least one mode is required")
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._slice = self._view
+        self._high_water_mark = 0
+
+    @property
+    def buffer(self) -> bytearray:
+        """The underlying buffer, for operations (such as ``find``) that a
+        `memoryview` does not support"""
+        return self._buffer
+
+    @property
+    def capacity(self) -> int:
+        """The size of the pool in bytes"""
+        return len(self._buffer)
+
+    @property
+    def high_water_mark(self) -> int:
+        """The largest number of bytes handed out so far"""
+        return self._high_water_mark
+
+    def get(self, size: int, colorspace: int) -> memoryview:
+        """Get a buffer for the given size and colorspace.
+
+        The returned `memoryview` shares memory with every other buffer from the
+        pool, so the previous frame is overwritten by the next capture.
+
+        Args:
+            size (int): One of the ``OV2640_SIZE_`` constants
+            colorspace (int): One of the ``OV2640_COLOR_`` constants
+        """
+        length = _capture_buffer_size(size, colorspace)
+        if length > len(self._buffer):
+            raise ValueError(f"Mode needs {length} bytes, pool only holds {len(self._buffer)}")
+        self._high_water_mark = max(self._high_water_mark, length)
+        if len(self._slice) != length:
+            self._slice = self._view[:length]
+        return self._slice
+
+
 class _RegBits:
     def __init__(self, bank: int, reg: int, shift: int, mask: int) -> None:
         self.bank = bank
@@ -984,6 +1331,10 @@ class _SCCBCameraBase:
     def __init__(self, i2c_bus: I2C, i2c_address: int) -> None:
         self._i2c_device = I2CDevice(i2c_bus, i2c_address)
         self._bank = None
+        self._write_delay = 0.001
+        # The last value written to each register, keyed by (bank << 8) | reg
+        self._registers = {}
+        self._transfer_buffer = bytearray(2)
 
     def _get_reg_bits(self, bank: int, reg: int, shift: int, mask: int) -> int:
         return (self._read_bank_register(bank, reg) >> shift) & mask
@@ -997,24 +1348,69 @@ class _SCCBCameraBase:
     def _write_list(self, reg_list: List[int]) -> None:
         for i in range(0, len(reg_list), 2):
             self._write_register(reg_list[i], reg_list[i + 1])
-            time.sleep(0.001)
+            if self._write_delay:
+                time.sleep(self._write_delay)
 
     def _write_bank_register(self, bank: int, reg: int, value: int) -> None:
         if self._bank != bank:
             self._write_register(_BANK_SEL, bank)
         self._write_register(reg, value)
 
+    def _write_bank_registers(self, bank: int, regs: Sequence[int], count: int = -1) -> None:
+        # Write the first count reg, value pairs (or all of them) in one bus
+        # transaction, so that they land as close together as possible
+        if count < 0:
+            count = len(regs) // 2
+        b = self._transfer_buffer
+        with self._i2c_device as i2c:
+            if self._bank != bank:
+                b[0] = _BANK_SEL
+                b[1] = bank
+                i2c.write(b)
+                self._bank = bank
+            for i in range(0, 2 * count, 2):
+                b[0] = regs[i]
+                b[1] = regs[i + 1]
+                i2c.write(b)
+                self._registers[(bank << 8) | b[0]] = b[1]
+
     def _read_bank_register(self, bank: int, reg: int) -> int:
         if self._bank != bank:
             self._write_register(_BANK_SEL, bank)
         result = self._read_register(reg)
         return result
 
+    def _read_bank_registers(self, bank: int, regs: Sequence[int], result: WriteableBuffer) -> None:
+        # Read several registers in one bus transaction
+        b = self._transfer_buffer
+        with self._i2c_device as i2c:
+            if self._bank != bank:
+                b[0] = _BANK_SEL
+                b[1] = bank
+                i2c.write(b)
+                self._bank = bank
+            for i, reg in enumerate(regs):
+                b[0] = reg
+                i2c.write(b, end=1)
+                i2c.readinto(b, end=1)
+                result[i] = b[0]
+
+    def _cached_register(self, bank: int, reg: int) -> int:
+        # The last value written to a register, read from the device only if
+        # the driver has not written it since the last reset
+        value = self._registers.get((bank << 8) | reg)
+        if value is None:
+            value = self._read_bank_register(bank, reg)
+            self._registers[(bank << 8) | reg] = value
+        return value
+
     def _write_register(self, reg: int, value: int) -> None:
         if reg == _BANK_SEL:
             if self._bank == value:
                 return
             self._bank = value
+        elif self._bank is not None:
+            self._registers[(self._bank << 8) | reg] = value
         # print(f"write_register {reg:02x} {value:02x}")
         b = bytearray(2)
         b[0] = reg
@@ -1101,10 +1497,24 @@ class OV2640(_SCCBCameraBase):
 
         self._write_bank_register(_BANK_SENSOR, _COM7, _COM7_SRST)
         time.sleep(0.001)
+        self._registers.clear()
 
         self._write_list(_ov2640_settings_cif)
 
         self._colorspace = OV2640_COLOR_RGB
+        self._byte_order = OV2640_BYTE_ORDER_BIG_ENDIAN
+        self._mode = None
+        self._clk_div = None
+        self._exposure_transfer = False
+        self._exposure_read = bytearray(3)
+        self._metering_read = bytearray(len(_metering_registers))
+        self._metering = Metering()
+        self._exposure_controller = None
+        self._special_effect = OV2640_EFFECT_NONE
+        self._brightness = 0
+        self._contrast = 0
+        self._saturation = 0
+        self._exposure_write = bytearray((_REG45, 0, _AEC, 0, _REG04, 0, _GAIN, 0))
         self._w = None
         self._h = None
         self._size = None
@@ -1114,10 +1524,13 @@ class OV2640(_SCCBCameraBase):
         self._flip_x = False
         self._flip_y = False
 
+        self._buffer_pool = None
+
         self.gain_ceiling = _COM9_AGC_GAIN_2x
         self.bpc = False
         self.wpc = True
         self.lenc = True
+        self.snapshot()
 
         # self._sensor_init()
 
@@ -1125,27 +1538,257 @@ class OV2640(_SCCBCameraBase):
             data_pins=data_pins, clock=clock, vsync=vsync, href=href
         )
 
-    def capture(self, buf: WriteableBuffer) -> Optional[memoryview]:
+    def capture(
+        self,
+        buf: Optional[WriteableBuffer] = None,
+        timeout: Optional[float] = None,
+        recover: bool = False,
+    ) -> Optional[memoryview]:
         """Capture an image into the buffer.
 
+        In JPEG mode, the returned memoryview holds just the JPEG data.
+
+        If ``timeout`` is given, the sensor is first checked over SCCB to be powered,
+        responding and still configured, retrying until the deadline and then
+        raising `CaptureTimeoutError`.  This catches a loose ribbon cable or a
+        brown-out before committing to the wait for a frame, which cannot itself be
+        interrupted once started.  With ``recover``, a sensor that has lost its
+        configuration is restored with `reset` instead.
+
         Args:
-            buf (WriteableBuffer): A WritableBuffer to contain the \
-                captured image.  Note that this can be a ulab array or a displayio Bitmap.
+            buf (Optional[WriteableBuffer]): A WritableBuffer to contain the \
+                captured image.  Note that this can be a ulab array or a displayio Bitmap. \
+                If None, the image is captured into the buffer pool (see \
+                `allocate_buffer_pool`) and a memoryview of it is always returned.
+            timeout (Optional[float]): The time in seconds allowed for the \
+                sensor to become ready, or None to capture unconditionally.
+            recover (bool): Reset and restore a sensor that has lost its \
+                configuration rather than waiting for the deadline.
         """
+        if timeout is not None:
+            self._check_ready(timeout, recover)
+        pool = None
+        if buf is None:
+            pool = self._buffer_pool
+            if pool is None:
+                raise RuntimeError("No buffer given and no buffer pool allocated")
+            buf = pool.get(self._size, self._colorspace)
         self._imagecapture.capture(buf)
+        self._frames_since_config += 1
+        if self._exposure_controller:
+            self._exposure_controller.update()
         if self.colorspace == OV2640_COLOR_JPEG:
-            eoi = buf.find(b"\xff\xd9")
+            if pool:
+                eoi = pool.buffer.find(b"\xff\xd9", 0, len(buf))
+            else:
+                eoi = buf.find(b"\xff\xd9")
             if eoi != -1:
                 # terminate the JPEG data just after the EOI marker
                 return memoryview(buf)[: eoi + 2]
+        if pool:
+            return buf
         return None
 
+    @property
+    def frames_since_reconfiguration(self) -> int:
+        """The number of frames captured since the size or colorspace last changed"""
+        return self._frames_since_config
+
+    def settle(
+        self,
+        buf: Optional[WriteableBuffer] = None,
+        tolerance: int = 4,
+        exposure_tolerance: float = 0.0625,
+        max_frames: int = 15,
+    ) -> int:
+        """Discard frames until automatic exposure has settled after a change of
+        size or colorspace, and return how many frames that took.
+
+        Exposure is settled once the average luminance (``YAVG``) changes by at most
+        ``tolerance`` and `exposure` by at most the fraction ``exposure_tolerance``
+        between consecutive frames.  Once settled, this returns 0 without capturing
+        until the next reconfiguration.
+
+        Args:
+            buf (Optional[WriteableBuffer]): The buffer to capture into, or None to \
+                use the buffer pool.
+            tolerance (int): The largest settled change in ``YAVG``, out of 255.
+            exposure_tolerance (float): The largest settled relative change in exposure.
+            max_frames (int): Give up after this many frames.
+        """
+        frames = 0
+        last_luminance = last_exposure = None
+        metering = self._metering
+        while not self._settled and frames < max_frames:
+            self.capture(buf)
+            frames += 1
+            self.meter(metering)
+            luminance = metering.luminance
+            exposure = metering.exposure
+            if last_luminance is not None:
+                self._settled = (
+                    abs(luminance - last_luminance) <= tolerance
+                    and abs(exposure - last_exposure) <= last_exposure * exposure_tolerance
+                )
+            last_luminance = luminance
+            last_exposure = exposure
+        return frames
+
+    def continuous_capture_start(self, buffer1: WriteableBuffer, buffer2: WriteableBuffer) -> None:
+        """Begin capturing into two buffers alternately, on ports that support it.
+
+        Args:
+            buffer1 (WriteableBuffer): The first capture buffer.
+            buffer2 (WriteableBuffer): The second capture buffer.
+        """
+        self._imagecapture.continuous_capture_start(buffer1, buffer2)
+
+    def continuous_capture_get_frame(
+        self, timeout: Optional[float] = None, recover: bool = False
+    ) -> memoryview:
+        """Wait for the next frame of a continuous capture and return it.
+
+        ``timeout`` and ``recover`` work as for `capture`.
+        """
+        if timeout is not None:
+            self._check_ready(timeout, recover)
+        frame = self._imagecapture.continuous_capture_get_frame()
+        self._frames_since_config += 1
+        if self._exposure_controller:
+            self._exposure_controller.update()
+        return frame
+
+    def continuous_capture_stop(self) -> None:
+        """Stop a continuous capture"""
+        self._imagecapture.continuous_capture_stop()
+
+    def _configured(self) -> bool:
+        # A brown-out resets the sensor to its defaults, losing the clock settings
+        return (
+            self._read_bank_register(_BANK_SENSOR, _REG_PID) == _OV2640_PID
+            and self._read_register(_CLKRC) == self._clkrc
+            and self._read_bank_register(_BANK_DSP, _R_DVP_SP) == self._dvp_sp
+        )
+
+    def _check_ready(self, timeout: float, recover: bool) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self._configured():
+                    return
+                if recover:
+                    self.reset()
+                    if self._configured():
+                        return
+            except OSError:
+                # A failed transfer leaves the selected bank unknown
+                self._bank = None
+            if time.monotonic() >= deadline:
+                raise CaptureTimeoutError("Camera not ready before the deadline")
+
+    def snapshot(self) -> None:
+        """Record the settings that `reset` restores but the driver does not track,
+        such as `gain_ceiling`, `bpc`, `wpc` and `lenc`.  This is done during
+        initialization; call it again after changing those settings."""
+        self._snapshot = bytes(
+            self._read_bank_register(bank, reg) for bank, reg in _SNAPSHOT_REGISTERS
+        )
+
+    def reset(self) -> None:
+        """Soft-reset the sensor and restore its configuration.
+
+        The size, colorspace and flip settings are restored, along with
+        `auto_exposure`, `auto_gain`, `auto_white_balance` and the registers
+        recorded by the last `snapshot`.  Register writes are not paced
+        during the restore, so it is much faster than initialization.
+        """
+        self._write_delay = 0
+        self._mode = None  # nothing to transfer exposure from
+        try:
+            self._bank = None
+            self._write_bank_register(_BANK_SENSOR, _COM7, _COM7_SRST)
+            time.sleep(0.001)
+            self._bank = None
+            cached = [
+                self._registers.get((bank << 8) | reg) for bank, reg in _CACHED_RESET_REGISTERS
+            ]
+            self._registers.clear()
+            self._write_list(_ov2640_settings_cif)
+            self._set_size_and_colorspace()
+            self._set_flip()
+            for (bank, reg), value in zip(_SNAPSHOT_REGISTERS, self._snapshot):
+                self._write_bank_register(bank, reg, value)
+            for (bank, reg), value in zip(_CACHED_RESET_REGISTERS, cached):
+                if value is not None:
+                    self._write_bank_register(bank, reg, value)
+            self._set_special_digital_effects()
+        finally:
+            self._write_delay = 0.001
+
+    def burst(self, count: int, buffers: Sequence[WriteableBuffer]) -> Tuple[List[int], List[int]]:
+        """Capture ``count`` frames back to back into a ring of buffers.
+
+        Frame ``i`` is captured into ``buffers[i % len(buffers)]``, so with fewer
+        buffers than frames the oldest frames are overwritten.  Nothing is
+        reconfigured or allocated between frames, so the sensor rate is kept as
+        long as the capture itself keeps up.
+
+        Returns ``(timestamps, skipped)``: the `time.monotonic_ns` value at which
+        each frame finished, and for each frame how many sensor frames were missed
+        just before it.  Missed frames are judged against the shortest interval in
+        the burst, so bursts of fewer than 3 frames never report any.
+
+        Args:
+            count (int): The number of frames to capture.
+            buffers (Sequence[WriteableBuffer]): The ring of capture buffers, each \
+                at least `capture_buffer_size` bytes.
+        """
+        ring = len(buffers)
+        timestamps = [0] * count
+        skipped = [0] * count
+        capture = self._imagecapture.capture
+        monotonic_ns = time.monotonic_ns
+        for i in range(count):
+            capture(buffers[i % ring])
+            timestamps[i] = monotonic_ns()
+        self._frames_since_config += count
+
+        if count > 2:
+            period = min(timestamps[i] - timestamps[i - 1] for i in range(1, count))
+            if period:
+                for i in range(1, count):
+                    interval = timestamps[i] - timestamps[i - 1]
+                    skipped[i] = (interval + period // 2) // period - 1
+        return timestamps, skipped
+
     @property
     def capture_buffer_size(self) -> int:
         """Return the size of capture buffer to use with current resolution & colorspace settings"""
-        if self.colorspace == OV2640_COLOR_JPEG:
-            return self.width * self.height // 5
-        return self.width * self.height * 2
+        return _capture_buffer_size(self._size, self._colorspace)
+
+    def allocate_buffer_pool(
+        self, modes: Optional[Sequence[Tuple[int, int]]] = None
+    ) -> FrameBufferPool:
+        """Allocate a `FrameBufferPool` for use by `capture` when no buffer is given.
+
+        Call this once at startup, listing every ``(size, colorspace)`` that will
+        be captured without an explicit buffer.  The pool is sized for the largest
+        of them, so later mode switches do not allocate.
+
+        Args:
+            modes (Optional[Sequence[Tuple[int, int]]]): The modes to size the \
+                pool for, or None for just the current size and colorspace.
+        """
+        if modes is None:
+            modes = ((self._size, self._colorspace),)
+        self._buffer_pool = None  # let the old pool be collected first
+        self._buffer_pool = FrameBufferPool(modes)
+        return self._buffer_pool
+
+    @property
+    def buffer_pool(self) -> Optional[FrameBufferPool]:
+        """The buffer pool allocated by `allocate_buffer_pool`, or None"""
+        return self._buffer_pool
 
     @property
     def mclk_frequency(self) -> Optional[int]:
@@ -1166,7 +1809,12 @@ class OV2640(_SCCBCameraBase):
 
     @property
     def colorspace(self) -> bytes:
-        """Get or set the colorspace, one of the ``OV2640_COLOR_`` constants."""
+        """Get or set the colorspace, one of the ``OV2640_COLOR_`` constants.
+
+        ``OV2640_COLOR_RAW`` captures 8-bit Bayer data, one byte per pixel.  The DSP
+        cannot scale Bayer data, so it is only useful at the sizes that match a
+        sensor mode: ``OV2640_SIZE_CIF``, ``OV2640_SIZE_SVGA`` and
+        ``OV2640_SIZE_UXGA``.  `adafruit_ov2640_convert` can demosaic it."""
         return self._colorspace
 
     @colorspace.setter
@@ -1174,6 +1822,23 @@ class OV2640(_SCCBCameraBase):
         self._colorspace = colorspace
         self._set_size_and_colorspace()
 
+    @property
+    def byte_order(self) -> int:
+        """Get or set the order in which the DSP outputs the two bytes of each
+        pixel, one of the ``OV2640_BYTE_ORDER_`` constants.
+
+        The default, big endian, sends the high byte of each RGB565 pixel first,
+        which displayio calls ``RGB565_SWAPPED``.  Little endian matches
+        displayio's ``RGB565``, ulab and numpy ``uint16`` arrays, and BMP files,
+        so frames can be used without swapping bytes on the CPU.  In YUV mode,
+        little endian sends each U or V byte before its Y byte."""
+        return self._byte_order
+
+    @byte_order.setter
+    def byte_order(self, byte_order: int) -> None:
+        self._byte_order = byte_order
+        self._set_colorspace()
+
     def _set_colorspace(self) -> None:
         colorspace = self._colorspace
         settings = _ov2640_color_settings[colorspace]
@@ -1181,6 +1846,22 @@ class OV2640(_SCCBCameraBase):
         self._write_list(settings)
         # written twice?
         self._write_list(settings)
+        if self._byte_order == OV2640_BYTE_ORDER_LITTLE_ENDIAN and colorspace in {
+            OV2640_COLOR_RGB,
+            OV2640_COLOR_YUV,
+        }:
+            image_mode = self._cached_register(_BANK_DSP, _IMAGE_MODE)
+            self._write_bank_registers(
+                _BANK_DSP,
+                (
+                    _RESET,
+                    _RESET_DVP,
+                    _IMAGE_MODE,
+                    image_mode | _IMAGE_MODE_LBYTE_FIRST,
+                    _RESET,
+                    0x00,
+                ),
+            )
         time.sleep(0.01)
 
     def deinit(self) -> None:
@@ -1199,26 +1880,7 @@ class OV2640(_SCCBCameraBase):
         return self._size
 
     def _set_size_and_colorspace(self) -> None:
-        size = self._size
-        width, height, ratio = _resolution_info[size]
-        offset_x, offset_y, max_x, max_y = _ratio_table[ratio]
-        mode = _OV2640_MODE_UXGA
-        if size <= OV2640_SIZE_CIF:
-            mode = _OV2640_MODE_CIF
-            max_x //= 4
-            max_y //= 4
-            offset_x //= 4
-            offset_y //= 4
-            max_y = min(max_y, 296)
-
-        elif size <= OV2640_SIZE_SVGA:
-            mode = _OV2640_MODE_SVGA
-            max_x //= 2
-            max_y //= 2
-            offset_x //= 2
-            offset_y //= 2
-
-        self._set_window(mode, offset_x, offset_y, max_x, max_y, width, height)
+        self._set_window(*_window_for_size(self._size))
 
     @size.setter
     def size(self, size: int) -> None:
@@ -1253,6 +1915,85 @@ class OV2640(_SCCBCameraBase):
         self._flip_y = bool(value)
         self._set_flip()
 
+    def _set_special_digital_effects(self) -> None:
+        # The DSP applies effects, brightness, contrast and saturation together,
+        # so write all of its indirect registers in one transaction
+        ctrl, fixed_u, fixed_v = _sde_effects[self._special_effect]
+        if self._brightness or self._contrast:
+            ctrl |= _SDE_CTRL_CONTRAST
+        if self._saturation:
+            ctrl |= _SDE_CTRL_SATURATION
+        saturation = 0x48 + 0x10 * self._saturation
+        # Low brightness with high contrast would take the Y offset below 0,
+        # which the register cannot hold, so it is clamped to the darkest
+        offset = max(0, 0x20 + 0x10 * self._brightness - 0x0A * self._contrast)
+        # fmt: off
+        self._write_bank_registers(
+            _BANK_DSP,
+            (
+                _BPADDR, _SDE_CTRL, _BPDATA, ctrl,
+                _BPADDR, _SDE_SATURATION, _BPDATA, saturation, _BPDATA, saturation,
+                _BPADDR, _SDE_FIXED_UV, _BPDATA, fixed_u, _BPDATA, fixed_v,
+                _BPADDR, _SDE_CONTRAST, _BPDATA, 0x20,
+                _BPDATA, 0x20 + 4 * self._contrast, _BPDATA, offset,
+                _BPDATA, 0x06 if self._contrast else 0x00,
+            ),
+        )
+        # fmt: on
+
+    def _set_sde_level(self, name: str, value: int) -> None:
+        if not -2 <= value <= 2:
+            raise ValueError("Value must be from -2 to 2")
+        # Only keep the new level once it has been written, so that a failed
+        # write does not break every later one
+        old_value = getattr(self, name)
+        setattr(self, name, value)
+        try:
+            self._set_special_digital_effects()
+        except Exception:
+            setattr(self, name, old_value)
+            raise
+
+    @property
+    def special_effect(self) -> int:
+        """Get or set the effect applied by the DSP, one of the ``OV2640_EFFECT_``
+        constants.  Effects cost nothing on the CPU, unlike processing each frame."""
+        return self._special_effect
+
+    @special_effect.setter
+    def special_effect(self, effect: int) -> None:
+        if not 0 <= effect < len(_sde_effects):
+            raise ValueError("Unknown effect")
+        self._special_effect = effect
+        self._set_special_digital_effects()
+
+    @property
+    def brightness(self) -> int:
+        """Get or set the brightness adjustment made by the DSP, from -2 to 2"""
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: int) -> None:
+        self._set_sde_level("_brightness", value)
+
+    @property
+    def contrast(self) -> int:
+        """Get or set the contrast adjustment made by the DSP, from -2 to 2"""
+        return self._contrast
+
+    @contrast.setter
+    def contrast(self, value: int) -> None:
+        self._set_sde_level("_contrast", value)
+
+    @property
+    def saturation(self) -> int:
+        """Get or set the saturation adjustment made by the DSP, from -2 to 2"""
+        return self._saturation
+
+    @saturation.setter
+    def saturation(self, value: int) -> None:
+        self._set_sde_level("_saturation", value)
+
     @property
     def product_id(self) -> int:
         """Get the product id (PID) register.  The expected value is 0x26."""
@@ -1276,36 +2017,14 @@ class OV2640(_SCCBCameraBase):
         self._w = width
         self._h = height
 
-        max_x //= 4
-        max_y //= 4
-        width //= 4
-        height //= 4
+        transfer = None
+        if self._exposure_transfer and self._mode is not None:
+            transfer = (
+                self.exposure,
+                _gain_from_register(self._read_bank_register(_BANK_SENSOR, _GAIN)),
+            )
 
-        win_regs = [
-            _BANK_SEL,
-            _BANK_DSP,
-            _HSIZE,
-            max_x & 0xFF,
-            _VSIZE,
-            max_y & 0xFF,
-            _XOFFL,
-            offset_x & 0xFF,
-            _YOFFL,
-            offset_y & 0xFF,
-            _VHYX,
-            ((max_y >> 1) & 0x80)
-            | ((offset_y >> 4) & 0x70)
-            | ((max_x >> 5) & 0x08)
-            | ((offset_y >> 8) & 0x07),
-            _TEST,
-            (max_x >> 2) & 0x80,
-            _ZMOW,
-            (width) & 0xFF,
-            _ZMOH,
-            (height) & 0xFF,
-            _ZMHH,
-            ((height >> 6) & 0x04) | ((width >> 8) & 0x03),
-        ]
+        win_regs = _window_registers(offset_x, offset_y, max_x, max_y, width, height)
 
         pclk_auto = 0
         pclk_div = 8
@@ -1334,6 +2053,12 @@ class OV2640(_SCCBCameraBase):
         self._write_list(win_regs)
         self._write_bank_register(_BANK_SENSOR, _CLKRC, clk)
         self._write_bank_register(_BANK_DSP, _R_DVP_SP, pclk)
+        self._clkrc = clk
+        self._dvp_sp = pclk
+        old_mode, old_clk_div = self._mode, self._clk_div
+        self._mode, self._clk_div = mode, clk_div
+        self._frames_since_config = 0
+        self._settled = False
         self._write_register(_R_BYPASS, _R_BYPASS_DSP_EN)
         time.sleep(0.01)
 
@@ -1344,21 +2069,231 @@ class OV2640(_SCCBCameraBase):
         if self._test_pattern:
             self.test_pattern = self._test_pattern
 
+        if transfer:
+            self._transfer_exposure(old_mode, old_clk_div, *transfer)
+
+    def _transfer_exposure(self, old_mode: int, old_clk_div: int, exposure: int, gain: int) -> None:
+        # Exposure is counted in lines, whose duration depends on the sensor mode
+        # and clock divider, so rescale it to keep the same exposure time.  Time
+        # that no longer fits in a frame is made up with gain.
+        exposure = (
+            exposure
+            * (old_clk_div + 1)
+            * _mode_lines_per_10ms[self._mode]
+            // ((self._clk_div + 1) * _mode_lines_per_10ms[old_mode])
+        )
+        max_exposure = _mode_frame_lines[self._mode]
+        if exposure > max_exposure:
+            gain = gain * exposure // max_exposure
+            exposure = max_exposure
+        self._write_exposure(max(exposure, 1), gain)
+
+    @property
+    def exposure_transfer(self) -> bool:
+        """Get or set whether exposure carries over when the sensor mode changes.
+
+        Exposure is counted in sensor lines, whose duration differs between the
+        modes used for small, medium and large sizes, and with the clock divider
+        used for JPEG.  When this is True, changing `size` or `colorspace` rescales
+        the exposure and gain so that the first frame in the new mode is exposed
+        like the last frame in the old one, instead of waiting for automatic
+        exposure to converge again."""
+        return self._exposure_transfer
+
+    @exposure_transfer.setter
+    def exposure_transfer(self, value: bool) -> None:
+        self._exposure_transfer = bool(value)
+
+    def _move_window(
+        self,
+        offset_x: int,
+        offset_y: int,
+        max_x: int,
+        max_y: int,
+        width: int,
+        height: int,
+    ) -> None:
+        # Change just the DSP window, keeping the sensor mode and clocks
+        self._write_bank_register(_BANK_DSP, _R_BYPASS, _R_BYPASS_DSP_BYPAS)
+        self._write_list(_window_registers(offset_x, offset_y, max_x, max_y, width, height))
+        self._write_register(_R_BYPASS, _R_BYPASS_DSP_EN)
+
+    def capture_strips(
+        self,
+        buf: WriteableBuffer,
+        callback: Callable[[memoryview, int], None],
+        lock_exposure: bool = True,
+    ) -> int:
+        """Capture an uncompressed image as a series of horizontal bands.
+
+        Each band comes from a separate frame, captured by moving the DSP window
+        down the sensor, so that an image much larger than memory can be streamed
+        to a file or the network.  ``callback(band, row)`` is called with each band
+        and the image row it starts at; the band is overwritten by the next capture.
+
+        Because the bands come from successive frames, the scene can change between
+        them.  Unless ``lock_exposure`` is False, automatic exposure and gain are
+        frozen while capturing so that the bands match in brightness.  The return
+        value is the largest difference in average luminance (``YAVG``) between any
+        two bands, which stays near 0 for a static scene.
+
+        Bands must be a whole number of 4-row units both in the image and on the
+        sensor, which the image is scaled from, so only some band heights are
+        possible.  The sizes that match a sensor mode, ``OV2640_SIZE_CIF``,
+        ``OV2640_SIZE_SVGA`` and ``OV2640_SIZE_UXGA``, allow 4-row bands, and VGA
+        and HD 16-row bands.  Others need much larger bands: half the image at the
+        sizes up to QVGA, 80 rows at HVGA, 64 rows (131kB) at XGA and a quarter of
+        the image (655kB) at SXGA.  A buffer too small for the smallest band
+        raises `ValueError` giving the size needed.
+
+        Args:
+            buf (WriteableBuffer): A buffer for one band.  Its length sets the band \
+                height, the largest possible that evenly divides the image.
+            callback (Callable[[memoryview, int], None]): Called with each band.
+            lock_exposure (bool): Freeze AEC and AGC while capturing.
+        """
+        if self._colorspace == OV2640_COLOR_JPEG:
+            raise ValueError("Strip capture needs an uncompressed colorspace")
+        # The sensor mode is unchanged, only the DSP window moves
+        _, offset_x, offset_y, max_x, max_y, width, height = _window_for_size(self._size)
+        row_bytes = _capture_buffer_size(self._size, self._colorspace) // height
+        rows = _band_height(len(buf) // row_bytes, height, max_y, row_bytes)
+        sensor_rows = rows * max_y // height
+        band = memoryview(buf)[: rows * row_bytes]
+
+        com8 = self._read_bank_register(_BANK_SENSOR, _COM8)
+        if lock_exposure:
+            self._write_register(_COM8, com8 & ~(_COM8_AGC_EN | _COM8_AEC_EN))
+        lowest = 255
+        highest = 0
+        try:
+            for row in range(0, height, rows):
+                self._move_window(
+                    offset_x,
+                    offset_y + row * max_y // height,
+                    max_x,
+                    sensor_rows,
+                    width,
+                    rows,
+                )
+                self._imagecapture.capture(band)
+                self._frames_since_config += 1
+                luminance = self._read_bank_register(_BANK_SENSOR, _YAVG)
+                lowest = min(lowest, luminance)
+                highest = max(highest, luminance)
+                callback(band, row)
+        finally:
+            self._move_window(offset_x, offset_y, max_x, max_y, width, height)
+            self._write_bank_register(_BANK_SENSOR, _COM8, com8)
+        return highest - lowest
+
+    @property
+    def exposure_controller(self) -> Optional[ExposureController]:
+        """Get or set an `ExposureController` to update after every frame
+        captured by `capture` or `continuous_capture_get_frame`, or None"""
+        return self._exposure_controller
+
+    @exposure_controller.setter
+    def exposure_controller(self, controller: Optional[ExposureController]) -> None:
+        self._exposure_controller = controller
+
+    def meter(self, result: Optional[Metering] = None) -> Metering:
+        """Read the sensor's exposure statistics.
+
+        The luminance, exposure and gain are read in a single bus transaction of a
+        few bytes, cheap enough to poll every frame for exposure control or scene
+        change detection instead of analyzing captured images.
+
+        Args:
+            result (Optional[Metering]): A `Metering` to fill in, to avoid \
+                allocating a new one on every call.
+        """
+        if result is None:
+            result = Metering()
+        regs = self._metering_read
+        self._read_bank_registers(_BANK_SENSOR, _metering_registers, regs)
+        result.exposure = (regs[1] & 0b11) | (regs[0] << 2) | ((regs[2] & 0b111111) << 10)
+        result.luminance = regs[3]
+        result.gain = _gain_from_register(regs[4]) / 16
+        return result
+
     @property
     def exposure(self) -> int:
-        """The exposure level of the sensor"""
-        aec_9_2 = self._get_reg_bits(_BANK_SENSOR, _AEC, 0, 0xFF)
-        aec_15_10 = self._get_reg_bits(_BANK_SENSOR, _REG45, 0, 0b111111)
-        aec_1_0 = self._get_reg_bits(_BANK_SENSOR, _REG04, 0, 0b11)
+        """Get or set the exposure time of the sensor, in lines.
 
-        return aec_1_0 | (aec_9_2 << 2) | (aec_15_10 << 10)
+        Setting the exposure does not turn off `auto_exposure`, which will
+        continue from the new value."""
+        regs = self._exposure_read
+        self._read_bank_registers(_BANK_SENSOR, _exposure_registers, regs)
+        return (regs[1] & 0b11) | (regs[0] << 2) | ((regs[2] & 0b111111) << 10)
 
     @exposure.setter
     def exposure(self, exposure: int) -> None:
-        aec_1_0 = exposure & 0x11
-        aec_9_2 = (exposure >> 2) & 0b11111111
-        aec_15_10 = exposure >> 10
+        self._write_exposure(exposure)
+
+    @property
+    def gain(self) -> float:
+        """Get or set the analog gain of the sensor, from 1 to 31.
+
+        Setting the gain does not turn off `auto_gain`, which will continue
+        from the new value."""
+        return _gain_from_register(self._read_bank_register(_BANK_SENSOR, _GAIN)) / 16
+
+    @gain.setter
+    def gain(self, gain: float) -> None:
+        self._write_bank_registers(_BANK_SENSOR, (_GAIN, _gain_to_register(round(gain * 16))))
+
+    def set_exposure_and_gain(self, exposure: int, gain: float) -> None:
+        """Set `exposure` and `gain` together, in a single bus transaction"""
+        self._write_exposure(exposure, round(gain * 16))
+
+    def _write_exposure(self, exposure: int, gain: Optional[int] = None) -> None:
+        # AEC[15:10] are in REG45, AEC[9:2] in AEC and AEC[1:0] in REG04.  They are
+        # all written in one transaction, keeping the other bits from the register
+        # cache rather than reading them back.  The gain is in sixteenths.
+        if not 0 <= exposure <= 0xFFFF:
+            raise ValueError("Exposure must be from 0 to 65535")
+        regs = self._exposure_write
+        regs[1] = (self._cached_register(_BANK_SENSOR, _REG45) & 0xC0) | (exposure >> 10)
+        regs[3] = (exposure >> 2) & 0xFF
+        regs[5] = (self._cached_register(_BANK_SENSOR, _REG04) & ~0b11) | (exposure & 0b11)
+        count = 3
+        if gain is not None:
+            regs[7] = _gain_to_register(gain)
+            count = 4
+        self._write_bank_registers(_BANK_SENSOR, regs, count)
+
+    def _set_cached_bit(self, bank: int, reg: int, bit: int, value: bool) -> None:
+        reg_value = self._cached_register(bank, reg)
+        if value:
+            reg_value |= bit
+        else:
+            reg_value &= ~bit
+        self._write_bank_registers(bank, (reg, reg_value))
+
+    @property
+    def auto_exposure(self) -> bool:
+        """Get or set whether the sensor controls the exposure automatically"""
+        return bool(self._cached_register(_BANK_SENSOR, _COM8) & _COM8_AEC_EN)
+
+    @auto_exposure.setter
+    def auto_exposure(self, value: bool) -> None:
+        self._set_cached_bit(_BANK_SENSOR, _COM8, _COM8_AEC_EN, value)
+
+    @property
+    def auto_gain(self) -> bool:
+        """Get or set whether the sensor controls the gain automatically"""
+        return bool(self._cached_register(_BANK_SENSOR, _COM8) & _COM8_AGC_EN)
+
+    @auto_gain.setter
+    def auto_gain(self, value: bool) -> None:
+        self._set_cached_bit(_BANK_SENSOR, _COM8, _COM8_AGC_EN, value)
+
+    @property
+    def auto_white_balance(self) -> bool:
+        """Get or set whether the DSP controls the white balance automatically"""
+        return bool(self._cached_register(_BANK_DSP, _CTRL1) & _CTRL1_AWB)
 
-        self._set_reg_bits(_BANK_SENSOR, _AEC, 0, 0xFF, aec_9_2)
-        self._set_reg_bits(_BANK_SENSOR, _REG45, 0, 0b111111, aec_15_10)
-        self._set_reg_bits(_BANK_SENSOR, _REG04, 0, 0b11, aec_1_0)
+    @auto_white_balance.setter
+    def auto_white_balance(self, value: bool) -> None:
+        self._set_cached_bit(_BANK_DSP, _CTRL1, _CTRL1_AWB, value)
@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_avi`
+================================================================================
+
+Record JPEG frames to a Motion JPEG AVI file, which plays in most video
+players and browsers' download previews.
+
+Frames are appended as they are captured, straight from the capture buffer.
+The only per-frame state is the size of each frame, kept in a preallocated
+`array.array`, and the index and final header are written when the file is
+closed.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import struct
+import time
+from array import array
+
+from adafruit_ov2640_sink import ChunkedSink
+
+try:
+    from typing import Any, Optional
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_AVIF_HASINDEX = 0x10
+_AVIIF_KEYFRAME = 0x10
+
+# RIFF, hdrl LIST, avih, strl LIST, strh and strf, then a JUNK chunk that
+# pads the header so that the frames start on a sector boundary
+_HEADER = "<4sI4s4sI4s4sI14I4sI4s4sI4s4sIHHIIIIIIIIhhhh4sIIiiHH4sIiiII4sI"
+_HEADER_SIZE = 512
+_HEADER_USED = struct.calcsize(_HEADER)
+_MOVI_HEADER = "<4sI4s"
+_MOVI_OFFSET = _HEADER_SIZE - 12
+_FRAME_HEADER = "<4sI"
+_INDEX_ENTRY = "<4sIII"
+_INDEX_BLOCK = 32
+
+
+class AVIWriter:
+    """Record JPEG frames to ``file``, an open, seekable file.
+
+    Each frame is stored padded to a multiple of 4 bytes, which JPEG decoders
+    ignore as it follows the end of the image.  Nothing is allocated per
+    frame, so recording keeps up with the camera as long as the card does.
+
+    The file is only playable once `close` has written the index and header.
+
+    Args:
+        file: The file to record to, opened with ``"wb"``.
+        width (int): The width of the frames.
+        height (int): The height of the frames.
+        fps (Optional[float]): The frame rate to play back at, or None to use \
+            the rate at which frames were written.
+        max_frames (int): The largest number of frames that can be recorded, \
+            which sets the size of the index kept in memory, 4 bytes per frame.
+        chunk_size (int): The size of the blocks that frames are written in.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        width: int,
+        height: int,
+        fps: Optional[float] = None,
+        max_frames: int = 1800,
+        chunk_size: int = 4096,
+    ) -> None:
+        self._file = file
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self._sizes = array("L", [0]) * max_frames
+        self._frames = 0
+        self._largest = 0
+        self._movi_length = 4
+        self._first = self._last = 0
+        self._sink = ChunkedSink(chunk_size)
+        self._frame_header = bytearray(8)
+        self._padding = memoryview(bytes(3))
+        self._header = bytearray(_HEADER_SIZE)
+        self._write_header()
+
+    @property
+    def frames(self) -> int:
+        """The number of frames recorded so far"""
+        return self._frames
+
+    @property
+    def max_frames(self) -> int:
+        """The largest number of frames that can be recorded"""
+        return len(self._sizes)
+
+    def _frame_interval(self) -> int:
+        # The time between frames in microseconds
+        if self.fps:
+            return round(1_000_000 / self.fps)
+        if self._frames > 1:
+            return max(1, (self._last - self._first) // (1000 * (self._frames - 1)))
+        return 66667
+
+    def _write_header(self) -> None:
+        frames = self._frames
+        interval = self._frame_interval()
+        largest = self._largest
+        header = self._header
+        struct.pack_into(
+            _HEADER,
+            header,
+            0,
+            # RIFF and hdrl LIST
+            b"RIFF",
+            _HEADER_SIZE - 12 + self._movi_length + 8 + 16 * frames,
+            b"AVI ",
+            b"LIST",
+            192,
+            b"hdrl",
+            # avih
+            b"avih",
+            56,
+            interval,
+            largest * 1_000_000 // interval,
+            0,
+            _AVIF_HASINDEX,
+            frames,
+            0,
+            1,
+            largest,
+            self.width,
+            self.height,
+            0,
+            0,
+            0,
+            0,
+            # strl LIST and strh
+            b"LIST",
+            116,
+            b"strl",
+            b"strh",
+            56,
+            b"vids",
+            b"MJPG",
+            0,
+            0,
+            0,
+            0,
+            interval,
+            1_000_000,
+            0,
+            frames,
+            largest,
+            0xFFFFFFFF,
+            0,
+            0,
+            0,
+            self.width,
+            self.height,
+            # strf, a BITMAPINFOHEADER
+            b"strf",
+            40,
+            40,
+            self.width,
+            self.height,
+            1,
+            24,
+            b"MJPG",
+            self.width * self.height * 3,
+            0,
+            0,
+            0,
+            0,
+            # JUNK
+            b"JUNK",
+            _MOVI_OFFSET - _HEADER_USED,
+        )
+        struct.pack_into(_MOVI_HEADER, header, _MOVI_OFFSET, b"LIST", self._movi_length, b"movi")
+        self._file.write(header)
+
+    def write_frame(self, data: ReadableBuffer, length: Optional[int] = None) -> None:
+        """Append a frame to the recording.
+
+        Args:
+            data (ReadableBuffer): The JPEG image, such as the `memoryview` \
+                returned by `adafruit_ov2640.OV2640.capture`.
+            length (Optional[int]): The number of bytes of ``data`` to write, \
+                or None for all of it.
+        """
+        frames = self._frames
+        if frames == len(self._sizes):
+            raise ValueError("Too many frames")
+        if length is None:
+            length = len(data)
+        padding = -length % 4
+        size = length + padding
+        if self.fps is None:
+            self._last = time.monotonic_ns()
+            if not frames:
+                self._first = self._last
+
+        struct.pack_into(_FRAME_HEADER, self._frame_header, 0, b"00dc", size)
+        self._file.write(self._frame_header)
+        self._sink.write(self._file, data, length)
+        if padding:
+            self._file.write(self._padding[:padding])
+
+        self._sizes[frames] = size
+        self._frames = frames + 1
+        self._largest = max(self._largest, size)
+        self._movi_length += 8 + size
+
+    def close(self) -> None:
+        """Write the index, update the header and close the file"""
+        file = self._file
+        sizes = self._sizes
+        block = bytearray(16 * _INDEX_BLOCK)
+        struct.pack_into(_FRAME_HEADER, block, 0, b"idx1", 16 * self._frames)
+        file.write(memoryview(block)[:8])
+        # Offsets are from the "movi" list type, and the frames are contiguous
+        offset = 4
+        for start in range(0, self._frames, _INDEX_BLOCK):
+            count = min(_INDEX_BLOCK, self._frames - start)
+            for i in range(count):
+                size = sizes[start + i]
+                struct.pack_into(
+                    _INDEX_ENTRY, block, 16 * i, b"00dc", _AVIIF_KEYFRAME, offset, size
+                )
+                offset += 8 + size
+            file.write(memoryview(block)[: 16 * count])
+        file.seek(0)
+        self._write_header()
+        file.close()
@@ -0,0 +1,371 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_convert`
+================================================================================
+
+Pixel format conversion for images captured by the OV2640.
+
+These work on the capture buffer in place or write into a buffer supplied by
+the caller.  They use ulab on CircuitPython and NumPy on a host computer.
+The whole-buffer converters, `yuv_to_rgb565`, `yuv_to_gray`,
+`rgb565_to_bgr565`, `rgb565_to_rgb888` and `byteswap16`, also work without
+either, much more slowly, in pure Python.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, ideally with ulab, or CPython, ideally with NumPy
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+try:
+    from typing import Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+BAYER_BGGR = 0
+BAYER_GBRG = 1
+BAYER_GRBG = 2
+BAYER_RGGB = 3
+
+# Per BAYER_ constant: the row and column of the red and blue pixels in each
+# 2x2 cell
+_bayer_offsets = (
+    (1, 1, 0, 0),
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, 0, 1, 1),
+)
+
+
+def _plane(buf, width: int, height: int, dtype=None):
+    return np.frombuffer(buf, dtype=dtype or np.uint8)[: width * height].reshape((height, width))
+
+
+def bayer_to_gray(src: ReadableBuffer, width: int, height: int, dest: WriteableBuffer) -> None:
+    """Convert a RAW Bayer image to 8-bit grayscale at half resolution.
+
+    Each 2x2 cell of the Bayer mosaic becomes one pixel, the average of its four
+    samples, so ``dest`` must hold ``(width // 2) * (height // 2)`` bytes.
+
+    Args:
+        src (ReadableBuffer): The Bayer image, as captured with ``OV2640_COLOR_RAW``
+        width (int): The width of the Bayer image
+        height (int): The height of the Bayer image
+        dest (WriteableBuffer): The grayscale image
+    """
+    raw = _plane(src, width, height)
+    out = _plane(dest, width // 2, height // 2)
+    total = np.array(raw[0::2, 0::2], dtype=np.uint16) + raw[0::2, 1::2]
+    total = total + raw[1::2, 0::2] + raw[1::2, 1::2]
+    out[:] = total >> 2
+
+
+def bayer_to_rgb565(
+    src: ReadableBuffer,
+    width: int,
+    height: int,
+    dest: WriteableBuffer,
+    pattern: int = BAYER_BGGR,
+) -> None:
+    """Demosaic a RAW Bayer image to RGB565 at half resolution.
+
+    Each 2x2 cell of the Bayer mosaic becomes one pixel, taking red and blue from
+    their samples and green from the average of the two green samples.  The
+    pixels are little endian, as displayio's ``Colorspace.RGB565`` expects, so
+    ``dest`` must hold ``(width // 2) * (height // 2) * 2`` bytes.
+
+    Args:
+        src (ReadableBuffer): The Bayer image, as captured with ``OV2640_COLOR_RAW``
+        width (int): The width of the Bayer image
+        height (int): The height of the Bayer image
+        dest (WriteableBuffer): The RGB565 image
+        pattern (int): The color of the first pixels, one of the ``BAYER_`` \
+            constants.  Flipping the image changes the pattern.
+    """
+    raw = _plane(src, width, height)
+    out = _plane(dest, width // 2, height // 2, np.uint16)
+    red_y, red_x, blue_y, blue_x = _bayer_offsets[pattern]
+    green = np.array(raw[red_y::2, blue_x::2], dtype=np.uint16) + raw[blue_y::2, red_x::2]
+    red = np.array(raw[red_y::2, red_x::2] >> 3, dtype=np.uint16)
+    out[:] = (red << 11) | ((green >> 3) << 5) | (raw[blue_y::2, blue_x::2] >> 3)
+
+
+def yuv_to_luma(
+    src: ReadableBuffer,
+    width: int,
+    height: int,
+    dest: WriteableBuffer,
+    scale: int = 1,
+    byte_order: int = 0,
+) -> None:
+    """Extract the luma (Y) plane of a YUV422 image, optionally downsampled.
+
+    With a ``scale`` of 2, 4 or 8, each pixel of ``dest`` is the average of a
+    ``scale`` x ``scale`` block of the image, so ``dest`` must hold
+    ``(width // scale) * (height // scale)`` bytes.
+
+    Args:
+        src (ReadableBuffer): The YUV422 image, as captured with ``OV2640_COLOR_YUV``
+        width (int): The width of the YUV image
+        height (int): The height of the YUV image
+        dest (WriteableBuffer): The luma image
+        scale (int): The downsampling factor, 1, 2, 4 or 8
+        byte_order (int): The byte order the image was captured with, one of \
+            the ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+    """
+    luma = _plane(src, 2 * width, height)[:, byte_order::2]
+    _box_filter(luma, width, height, dest, scale)
+
+
+def downsample(src: ReadableBuffer, width: int, height: int, dest: WriteableBuffer) -> None:
+    """Halve the size of an 8-bit grayscale image with a 2x2 box filter.
+
+    Applied repeatedly to the output of `yuv_to_luma`, this builds a luma
+    pyramid, each level in its own buffer of ``(width // 2) * (height // 2)`` bytes.
+
+    Args:
+        src (ReadableBuffer): The grayscale image
+        width (int): The width of the grayscale image
+        height (int): The height of the grayscale image
+        dest (WriteableBuffer): The downsampled image
+    """
+    _box_filter(_plane(src, width, height), width, height, dest, 2)
+
+
+def _box_filter(plane, width: int, height: int, dest: WriteableBuffer, scale: int) -> None:
+    out = _plane(dest, width // scale, height // scale)
+    if scale == 1:
+        out[:] = plane
+        return
+    shift = {2: 2, 4: 4, 8: 6}[scale]
+    out_height = height // scale * scale
+    out_width = width // scale * scale
+    # Sum rows, then columns, of each block
+    rows = np.array(plane[0:out_height:scale, :out_width], dtype=np.uint16)
+    for y in range(1, scale):
+        rows += plane[y:out_height:scale, :out_width]
+    total = np.array(rows[:, 0::scale])
+    for x in range(1, scale):
+        total += rows[:, x::scale]
+    out[:] = total >> shift
+
+
+def _pixels(buf, byte_order: int):
+    # The 16-bit pixels of buf, as a little endian array in memory order when
+    # byte_order is OV2640_BYTE_ORDER_LITTLE_ENDIAN, and as a copy otherwise
+    pixels = np.frombuffer(buf, dtype=np.uint16)
+    if byte_order == 0:
+        return pixels.byteswap()
+    return pixels
+
+
+def _store_pixels(dest, pixels, byte_order: int) -> None:
+    if byte_order == 0:
+        pixels = pixels.byteswap()
+    np.frombuffer(dest, dtype=np.uint16)[: len(pixels)] = pixels
+
+
+def yuv_to_rgb565(
+    src: WriteableBuffer,
+    dest: Optional[WriteableBuffer] = None,
+    byte_order: int = 0,
+    dest_byte_order: int = 1,
+) -> None:
+    """Convert a YUV422 image to RGB565, in place or into ``dest``.
+
+    Every pixel in ``src`` is converted, using the full range BT.601 equations
+    the OV2640 encodes with.  To convert only part of a larger buffer, pass a
+    ``memoryview`` slice of it.
+
+    Args:
+        src (WriteableBuffer): The YUV422 image, as captured with ``OV2640_COLOR_YUV``
+        dest (Optional[WriteableBuffer]): The RGB565 image, the same size as \
+            ``src``.  If `None`, ``src`` is converted in place.
+        byte_order (int): The byte order the image was captured with, one of \
+            the ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+        dest_byte_order (int): The byte order of the RGB565 image.  The default, \
+            little endian, is displayio's ``Colorspace.RGB565``.
+    """
+    if dest is None:
+        dest = src
+    if np is None:
+        _yuv_to_rgb565_python(src, dest, byte_order, dest_byte_order)
+        return
+    count = len(src) // 4
+    pairs = np.frombuffer(src, dtype=np.uint8)[: count * 4].reshape((count, 4))
+    u = np.array(pairs[:, 1 - byte_order], dtype=np.int16) - 128
+    v = np.array(pairs[:, 3 - byte_order], dtype=np.int16) - 128
+    # Fixed point with 6 fractional bits, shared by the two pixels of a pair
+    red = v * 90
+    green = u * -22 - v * 46
+    blue = u * 113
+    result = []
+    for offset in (byte_order, 2 + byte_order):
+        y = np.array(pairs[:, offset], dtype=np.int16) * 64
+        r = np.array(np.clip(y + red, 0, 16383), dtype=np.uint16) >> 9
+        g = np.array(np.clip(y + green, 0, 16383), dtype=np.uint16) >> 8
+        b = np.array(np.clip(y + blue, 0, 16383), dtype=np.uint16) >> 9
+        result.append((r << 11) | (g << 5) | b)
+    # Both pixels are computed before either is stored, so src may be dest
+    out = np.frombuffer(dest, dtype=np.uint16)[: count * 2].reshape((count, 2))
+    for i, pixels in enumerate(result):
+        out[:, i] = pixels.byteswap() if dest_byte_order == 0 else pixels
+
+
+def _yuv_to_rgb565_python(src, dest, byte_order: int, dest_byte_order: int) -> None:
+    high = dest_byte_order
+    low = 1 - dest_byte_order
+    for i in range(0, len(src) - 3, 4):
+        u = src[i + 1 - byte_order] - 128
+        v = src[i + 3 - byte_order] - 128
+        red = v * 90
+        green = u * -22 - v * 46
+        blue = u * 113
+        y0 = src[i + byte_order] * 64
+        y1 = src[i + 2 + byte_order] * 64
+        for j, y in ((i, y0), (i + 2, y1)):
+            r = min(max(y + red, 0), 16383) >> 9
+            g = min(max(y + green, 0), 16383) >> 8
+            b = min(max(y + blue, 0), 16383) >> 9
+            dest[j + high] = (r << 3) | (g >> 3)
+            dest[j + low] = ((g << 5) | b) & 0xFF
+
+
+def yuv_to_gray(
+    src: WriteableBuffer, dest: Optional[WriteableBuffer] = None, byte_order: int = 0
+) -> None:
+    """Convert a YUV422 image to 8-bit grayscale, in place or into ``dest``.
+
+    This is `yuv_to_luma` for a whole buffer, without needing its dimensions.
+    ``dest`` holds one byte per pixel, half the size of ``src``.  In place,
+    the grayscale image fills the first half of ``src``.
+
+    Args:
+        src (WriteableBuffer): The YUV422 image, as captured with ``OV2640_COLOR_YUV``
+        dest (Optional[WriteableBuffer]): The grayscale image.  If `None`, \
+            ``src`` is converted in place.
+        byte_order (int): The byte order the image was captured with, one of \
+            the ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+    """
+    if dest is None:
+        dest = src
+    count = len(src) // 2
+    if np is None:
+        for i in range(count):
+            dest[i] = src[2 * i + byte_order]
+        return
+    # Each byte is read before it can be overwritten, so src may be dest
+    np.frombuffer(dest, dtype=np.uint8)[:count] = np.frombuffer(src, dtype=np.uint8)[
+        byte_order : 2 * count : 2
+    ]
+
+
+def rgb565_to_bgr565(
+    src: WriteableBuffer, dest: Optional[WriteableBuffer] = None, byte_order: int = 0
+) -> None:
+    """Exchange the red and blue fields of each RGB565 pixel, in place or into
+    ``dest``.  This converts RGB565 to BGR565, and BGR565 back to RGB565.
+
+    Args:
+        src (WriteableBuffer): The RGB565 image
+        dest (Optional[WriteableBuffer]): The BGR565 image, the same size as \
+            ``src``.  If `None`, ``src`` is converted in place.
+        byte_order (int): The byte order of the image, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+    """
+    if dest is None:
+        dest = src
+    if np is None:
+        high = byte_order
+        low = 1 - byte_order
+        for i in range(0, len(src) - 1, 2):
+            pixel = (src[i + high] << 8) | src[i + low]
+            pixel = ((pixel & 0x1F) << 11) | (pixel & 0x7E0) | (pixel >> 11)
+            dest[i + high] = pixel >> 8
+            dest[i + low] = pixel & 0xFF
+        return
+    pixels = _pixels(src, byte_order)
+    _store_pixels(dest, ((pixels & 0x1F) << 11) | (pixels & 0x7E0) | (pixels >> 11), byte_order)
+
+
+bgr565_to_rgb565 = rgb565_to_bgr565
+
+
+def rgb565_to_rgb888(src: ReadableBuffer, dest: WriteableBuffer, byte_order: int = 0) -> None:
+    """Convert an RGB565 image to 24-bit RGB, three bytes per pixel in the
+    order red, green, blue.
+
+    The low bits of each 8-bit value repeat its high bits, so that full
+    intensity in RGB565 is full intensity in RGB888.  ``dest`` must hold
+    ``len(src) * 3 // 2`` bytes.
+
+    Args:
+        src (ReadableBuffer): The RGB565 image
+        dest (WriteableBuffer): The RGB888 image
+        byte_order (int): The byte order of ``src``, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+    """
+    count = len(src) // 2
+    if np is None:
+        high = byte_order
+        low = 1 - byte_order
+        for i in range(count):
+            pixel = (src[2 * i + high] << 8) | src[2 * i + low]
+            red = pixel >> 11
+            green = (pixel >> 5) & 0x3F
+            blue = pixel & 0x1F
+            dest[3 * i] = (red << 3) | (red >> 2)
+            dest[3 * i + 1] = (green << 2) | (green >> 4)
+            dest[3 * i + 2] = (blue << 3) | (blue >> 2)
+        return
+    pixels = _pixels(src, byte_order)
+    out = np.frombuffer(dest, dtype=np.uint8)[: count * 3].reshape((count, 3))
+    red = pixels >> 11
+    green = (pixels >> 5) & 0x3F
+    blue = pixels & 0x1F
+    out[:, 0] = (red << 3) | (red >> 2)
+    out[:, 1] = (green << 2) | (green >> 4)
+    out[:, 2] = (blue << 3) | (blue >> 2)
+
+
+def byteswap16(src: WriteableBuffer, dest: Optional[WriteableBuffer] = None) -> None:
+    """Swap the two bytes of each 16-bit pixel, in place or into ``dest``.
+
+    This converts between the two ``adafruit_ov2640.OV2640_BYTE_ORDER_`` orders,
+    for example between displayio's ``RGB565`` and ``RGB565_SWAPPED``.  When the
+    camera itself is the source, setting its
+    `adafruit_ov2640.OV2640.byte_order` avoids the conversion altogether.
+
+    Args:
+        src (WriteableBuffer): The image
+        dest (Optional[WriteableBuffer]): The swapped image, the same size as \
+            ``src``.  If `None`, ``src`` is swapped in place.
+    """
+    if dest is None:
+        dest = src
+    if np is None:
+        for i in range(0, len(src) - 1, 2):
+            dest[i], dest[i + 1] = src[i + 1], src[i]
+        return
+    pixels = np.frombuffer(src, dtype=np.uint16)
+    np.frombuffer(dest, dtype=np.uint16)[: len(pixels)] = pixels.byteswap()
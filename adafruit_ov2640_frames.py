@@ -0,0 +1,335 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_frames`
+================================================================================
+
+A container for recording a sequence of uncompressed frames to a single file,
+and reading it back on a host computer.
+
+Recording appends every frame to one file in large sequential writes, rather
+than creating a file per frame, and a recording can be memory-mapped on the
+host and viewed as a NumPy array without copying it.
+
+The file starts with a 512 byte header::
+
+    magic        4s  b"OVRF"
+    version      H   1
+    colorspace   B   one of the adafruit_ov2640.OV2640_COLOR_ constants
+    byte_order   B   one of the adafruit_ov2640.OV2640_BYTE_ORDER_ constants
+    width        I
+    height       I
+    frame_size   I   bytes of pixel data per frame
+    frame_count  I   0 until the recording is closed
+    index_offset I   0 until the recording is closed
+    start        Q   time.monotonic_ns() of the first frame, 0 until closed
+
+followed by the frames, each a 16 byte header and ``frame_size`` bytes of
+pixels::
+
+    sequence     I   the frame number, from 0
+    timestamp    I   microseconds since the first frame, so up to 71 minutes
+    exposure     H   the exposure in lines, or 0 if not recorded
+    gain         H   the analog gain in sixteenths, or 0 if not recorded
+    reserved     I   0
+
+and then the index, the ``timestamp`` of each frame as a little endian
+32-bit number.  All numbers are little endian.  As the frames are all the same
+size, a recording that was never closed can still be read up to its last
+whole frame.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython to read recordings
+* NumPy, for `FrameReader.to_numpy`
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import struct
+import time
+
+from adafruit_ov2640_sink import ChunkedSink
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Any, List, Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_MAGIC = b"OVRF"
+_VERSION = 1
+_HEADER = "<4sHBBIIIIIQ"
+_HEADER_SIZE = 512
+_FRAME_HEADER = "<IIHHI"
+_FRAME_HEADER_SIZE = 16
+
+# The OV2640_COLOR_ constants, which are not imported so that recordings can
+# be read without the camera driver's hardware dependencies
+_COLOR_RGB = 0
+_COLOR_YUV = 1
+_COLOR_RAW = 3
+
+
+def _frame_size(width: int, height: int, colorspace: int) -> int:
+    if colorspace == _COLOR_RAW:
+        return width * height
+    if colorspace in {_COLOR_RGB, _COLOR_YUV}:
+        return 2 * width * height
+    raise ValueError("Only RGB, YUV and RAW frames can be recorded")
+
+
+class FrameWriter:
+    """Record uncompressed frames to ``file``, an open, seekable file.
+
+    Nothing is allocated per frame: the frame header is packed into a
+    preallocated buffer and the index is kept in a preallocated
+    `bytearray`, so each frame costs one small and one large write.  The
+    header and index are completed by `close`.
+
+    Args:
+        file: The file to record to, opened with ``"wb"``.
+        width (int): The width of the frames.
+        height (int): The height of the frames.
+        colorspace (int): The colorspace of the frames, one of the \
+            ``adafruit_ov2640.OV2640_COLOR_`` constants other than JPEG.
+        byte_order (int): The byte order of the frames, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants.
+        max_frames (int): The largest number of frames that can be recorded, \
+            which sets the size of the index kept in memory, 4 bytes per frame.
+        chunk_size (int): The size of the blocks that frames are written in.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        width: int,
+        height: int,
+        colorspace: int = _COLOR_RGB,
+        byte_order: int = 0,
+        max_frames: int = 3600,
+        chunk_size: int = 4096,
+    ) -> None:
+        self._file = file
+        self.width = width
+        self.height = height
+        self.colorspace = colorspace
+        self.byte_order = byte_order
+        self.frame_size = _frame_size(width, height, colorspace)
+        self._index = bytearray(4 * max_frames)
+        self._frames = 0
+        self._start = 0
+        self._sink = ChunkedSink(chunk_size)
+        self._frame_header = bytearray(_FRAME_HEADER_SIZE)
+        self._header = bytearray(_HEADER_SIZE)
+        self._write_header(0)
+
+    @property
+    def frames(self) -> int:
+        """The number of frames recorded so far"""
+        return self._frames
+
+    def _write_header(self, index_offset: int) -> None:
+        struct.pack_into(
+            _HEADER,
+            self._header,
+            0,
+            _MAGIC,
+            _VERSION,
+            self.colorspace,
+            self.byte_order,
+            self.width,
+            self.height,
+            self.frame_size,
+            self._frames if index_offset else 0,
+            index_offset,
+            self._start,
+        )
+        self._file.write(self._header)
+
+    def write_frame(
+        self,
+        data: ReadableBuffer,
+        exposure: int = 0,
+        gain: float = 0,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Append a frame to the recording.
+
+        Args:
+            data (ReadableBuffer): The frame, at least ``frame_size`` bytes, such \
+                as the buffer passed to `adafruit_ov2640.OV2640.capture`.
+            exposure (int): The `adafruit_ov2640.OV2640.exposure` of the frame, \
+                or 0.
+            gain (float): The `adafruit_ov2640.OV2640.gain` of the frame, or 0.
+            timestamp (Optional[int]): The `time.monotonic_ns` value at which \
+                the frame was captured, or None for now.
+        """
+        frames = self._frames
+        if 4 * frames == len(self._index):
+            raise ValueError("Too many frames")
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        if not frames:
+            self._start = timestamp
+        microseconds = (timestamp - self._start) // 1000
+
+        struct.pack_into(
+            _FRAME_HEADER,
+            self._frame_header,
+            0,
+            frames,
+            microseconds,
+            exposure,
+            int(gain * 16),
+            0,
+        )
+        self._file.write(self._frame_header)
+        self._sink.write(self._file, data, self.frame_size)
+        struct.pack_into("<I", self._index, 4 * frames, microseconds)
+        self._frames = frames + 1
+
+    def close(self) -> None:
+        """Write the index, complete the header and close the file"""
+        file = self._file
+        index_offset = _HEADER_SIZE + self._frames * (_FRAME_HEADER_SIZE + self.frame_size)
+        self._sink.write(file, self._index, 4 * self._frames)
+        file.seek(0)
+        self._write_header(index_offset)
+        file.close()
+
+
+class FrameReader:
+    """Read a recording made by `FrameWriter`, on a host computer.
+
+    The file is memory-mapped, so opening even a large recording is quick, and
+    frames are only read from disk as they are used.
+
+    Args:
+        path (str): The path of the recording.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.colorspace,
+            self.byte_order,
+            self.width,
+            self.height,
+            self.frame_size,
+            frames,
+            self._index_offset,
+            self.start,
+        ) = struct.unpack_from(_HEADER, self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a frame recording")
+        self.stride = _FRAME_HEADER_SIZE + self.frame_size
+        if not self._index_offset:
+            # Never closed, so use every whole frame that made it to the file
+            frames = (len(self._map) - _HEADER_SIZE) // self.stride
+        self.frames = frames
+
+    def __len__(self) -> int:
+        return self.frames
+
+    def close(self) -> None:
+        """Unmap the recording, once any arrays from `to_numpy` have been deleted"""
+        self._map.close()
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self.frames:
+            raise IndexError("Frame index out of range")
+        return _HEADER_SIZE + index * self.stride
+
+    def frame(self, index: int) -> memoryview:
+        """The pixels of a frame, without copying them
+
+        Args:
+            index (int): The frame number
+        """
+        offset = self._offset(index) + _FRAME_HEADER_SIZE
+        return memoryview(self._map)[offset : offset + self.frame_size]
+
+    def metadata(self, index: int) -> Tuple[int, int, int, float]:
+        """The ``(sequence, timestamp, exposure, gain)`` recorded with a frame,
+        with the timestamp in microseconds since the first frame
+
+        Args:
+            index (int): The frame number
+        """
+        sequence, timestamp, exposure, gain, _ = struct.unpack_from(
+            _FRAME_HEADER, self._map, self._offset(index)
+        )
+        return sequence, timestamp, exposure, gain / 16
+
+    def timestamps(self) -> List[int]:
+        """The timestamp of every frame, in microseconds since the first frame"""
+        if self._index_offset:
+            return list(struct.unpack_from(f"<{self.frames}I", self._map, self._index_offset))
+        return [self.metadata(i)[1] for i in range(self.frames)]
+
+    def find(self, timestamp: int) -> int:
+        """The number of the first frame at or after ``timestamp``, or the
+        number of frames if there is none
+
+        Args:
+            timestamp (int): The time in microseconds since the first frame
+        """
+        timestamps = self.timestamps()
+        low, high = 0, len(timestamps)
+        while low < high:
+            middle = (low + high) // 2
+            if timestamps[middle] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def to_numpy(self) -> Any:
+        """A NumPy structured array of every frame, viewing the memory-mapped
+        file without copying it.
+
+        The fields are ``sequence``, ``timestamp``, ``exposure``, ``gain`` (in
+        sixteenths) and ``pixels``, which is ``(height, width)`` 16-bit RGB565
+        pixels in the recorded byte order, ``(height, width, 2)`` bytes of
+        interleaved YUV, or ``(height, width)`` bytes of Bayer data.
+        """
+        if self.colorspace == _COLOR_RGB:
+            pixels = (">u2" if self.byte_order == 0 else "<u2", (self.height, self.width))
+        elif self.colorspace == _COLOR_YUV:
+            pixels = ("u1", (self.height, self.width, 2))
+        else:
+            pixels = ("u1", (self.height, self.width))
+        dtype = np.dtype(
+            [
+                ("sequence", "<u4"),
+                ("timestamp", "<u4"),
+                ("exposure", "<u2"),
+                ("gain", "<u2"),
+                ("reserved", "<u4"),
+                ("pixels", *pixels),
+            ]
+        )
+        return np.frombuffer(self._map, dtype, self.frames, _HEADER_SIZE)
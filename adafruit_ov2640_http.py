@@ -0,0 +1,366 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_http`
+================================================================================
+
+Serve camera frames to web browsers as a JPEG snapshot and a Motion JPEG
+stream.
+
+Every client is served from one cache of recently captured frames, so each
+frame is captured once however many clients are watching, and is sent to each
+of them straight from the cache.  Sockets are non-blocking: a client that
+cannot keep up is sent the newest frame each time it finishes the last one,
+rather than holding up the camera or the other clients.
+
+The server runs on CircuitPython with ``socketpool``, and on CPython with the
+standard `socket` module and `SimulatedCamera` in place of the camera.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import time
+from errno import EAGAIN
+
+try:
+    from typing import Any, Optional, Sequence
+
+    from circuitpython_typing import WriteableBuffer
+except ImportError:
+    pass
+
+_BOUNDARY = "frame"
+_STREAM_HEADER = (
+    "HTTP/1.1 200 OK\r\n"
+    f"Content-Type: multipart/x-mixed-replace; boundary={_BOUNDARY}\r\n"
+    "Cache-Control: no-cache\r\n"
+    "Connection: close\r\n\r\n"
+).encode()
+_PART_HEADER = f"--{_BOUNDARY}\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+_PART_TRAILER = b"\r\n"
+_SNAPSHOT_HEADER = (
+    "HTTP/1.1 200 OK\r\n"
+    "Content-Type: image/jpeg\r\n"
+    "Content-Length: %d\r\n"
+    "Cache-Control: no-cache\r\n"
+    "Connection: close\r\n\r\n"
+)
+_INDEX_PAGE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Connection: close\r\n\r\n"
+    b'<!DOCTYPE html><html><body><img src="/stream"></body></html>\n'
+)
+_NOT_FOUND = (
+    b"HTTP/1.1 404 Not Found\r\nContent-Type: text/plain\r\nConnection: close\r\n\r\nNot found\n"
+)
+
+_READING = 0
+_SNAPSHOT = 1
+_STREAM = 2
+_CLOSING = 3
+
+
+class FrameCache:
+    """A set of preallocated slots holding the most recently captured frames.
+
+    A slot is reference counted while clients send from it, and is only
+    captured into again once they have all released it.  With at least two
+    more slots than clients, there is always a slot free to capture into.
+
+    Args:
+        slots (int): The number of frames to keep.
+        slot_size (int): The size of each slot, such as \
+            `adafruit_ov2640.OV2640.capture_buffer_size` in JPEG mode.
+    """
+
+    def __init__(self, slots: int, slot_size: int) -> None:
+        # The camera searches the slot for the end of the JPEG data, so it is
+        # given the bytearray itself rather than a memoryview
+        self._buffers = [bytearray(slot_size) for _ in range(slots)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._lengths = [0] * slots
+        self._references = [0] * slots
+        self._latest = -1
+        self.sequence = 0
+        """The number of frames captured so far"""
+
+    def update(self, camera: Any) -> bool:
+        """Capture a frame into a free slot and make it the latest, returning
+        whether there was a free slot and the capture succeeded
+
+        Args:
+            camera: The camera, or anything with a compatible ``capture`` method.
+        """
+        references = self._references
+        for slot in range(len(references)):
+            if not references[slot] and slot != self._latest:
+                break
+        else:
+            return False
+        jpeg = camera.capture(self._buffers[slot])
+        if not jpeg:
+            return False
+        self._lengths[slot] = len(jpeg)
+        self._latest = slot
+        self.sequence += 1
+        return True
+
+    def acquire(self) -> int:
+        """Hold the latest frame, and return its slot, or -1 if there is none yet"""
+        slot = self._latest
+        if slot >= 0:
+            self._references[slot] += 1
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Let a slot held by `acquire` be captured into again
+
+        Args:
+            slot (int): The slot
+        """
+        self._references[slot] -= 1
+
+    def frame(self, slot: int) -> memoryview:
+        """The JPEG data in a slot, without copying it
+
+        Args:
+            slot (int): The slot
+        """
+        return self._views[slot][: self._lengths[slot]]
+
+
+class _Client:
+    def __init__(self, sock: Any) -> None:
+        sock.setblocking(False)
+        self.socket = sock
+        self.request = bytearray(1024)
+        self.received = 0
+        self.state = _READING
+        self.slot = -1
+        self.sequence = 0
+        self.pending = []
+
+    def read_request(self) -> Optional[bytes]:
+        # Return the path once the whole request has been read
+        view = memoryview(self.request)
+        count = self.socket.recv_into(view[self.received :])
+        if not count:
+            raise OSError("Connection closed")
+        self.received += count
+        request = self.request
+        if request.find(b"\r\n\r\n", 0, self.received) < 0 and self.received < len(request):
+            return None
+        line = bytes(view[: request.find(b"\r\n")]).split(b" ")
+        return line[1] if len(line) > 1 else b""
+
+    def route(self, path: bytes) -> None:
+        # Choose the response to the request for path
+        path = path.split(b"?", 1)[0]
+        if path == b"/snapshot.jpg":
+            self.state = _SNAPSHOT
+        elif path == b"/stream":
+            self.state = _STREAM
+            self.pending.append(memoryview(_STREAM_HEADER))
+        else:
+            self.state = _CLOSING
+            self.pending.append(memoryview(_INDEX_PAGE if path == b"/" else _NOT_FOUND))
+
+    def send(self) -> bool:
+        # Send as much as the socket will take, returning whether it all went
+        pending = self.pending
+        while pending:
+            sent = self.socket.send(pending[0])
+            if sent < len(pending[0]):
+                pending[0] = pending[0][sent:]
+                return False
+            pending.pop(0)
+        return True
+
+
+class MJPEGServer:
+    """Serve a JPEG snapshot and a Motion JPEG stream over HTTP.
+
+    The paths served are ``/snapshot.jpg``, a single frame, ``/stream``, a
+    ``multipart/x-mixed-replace`` stream that browsers show as live video, and
+    ``/``, a page showing the stream.
+
+    Call `poll` in a loop, or `serve_forever`.  Frames are only captured while
+    a client is connected.
+
+    Args:
+        camera: The camera, in JPEG mode, or a `SimulatedCamera`.
+        socket_source: A ``socketpool.SocketPool``, or the CPython `socket` module.
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        max_clients (int): The largest number of clients served at once.
+    """
+
+    def __init__(
+        self,
+        camera: Any,
+        socket_source: Any,
+        host: str = "0.0.0.0",
+        port: int = 80,
+        max_clients: int = 4,
+    ) -> None:
+        self.camera = camera
+        self.host = host
+        self.port = port
+        self.max_clients = max_clients
+        self._socket_source = socket_source
+        self._listener = None
+        self._clients = []
+        self.cache = FrameCache(max_clients + 2, camera.capture_buffer_size)
+        """The `FrameCache` that clients are served from"""
+
+    @property
+    def clients(self) -> int:
+        """The number of clients connected"""
+        return len(self._clients)
+
+    def start(self) -> None:
+        """Start listening for clients"""
+        source = self._socket_source
+        listener = source.socket(source.AF_INET, source.SOCK_STREAM)
+        reuse = getattr(source, "SO_REUSEADDR", None)
+        if reuse is not None:
+            listener.setsockopt(source.SOL_SOCKET, reuse, 1)
+        listener.bind((self.host, self.port))
+        listener.listen(self.max_clients)
+        listener.setblocking(False)
+        self._listener = listener
+
+    def stop(self) -> None:
+        """Disconnect every client and stop listening"""
+        for client in self._clients[:]:
+            self._close(client)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def serve_forever(self) -> None:
+        """Start listening, and serve clients until interrupted"""
+        if self._listener is None:
+            self.start()
+        try:
+            while True:
+                self.poll()
+        finally:
+            self.stop()
+
+    def poll(self) -> None:
+        """Accept new clients, capture a frame if any are connected, and send
+        to each client as much as it will take without blocking"""
+        self._accept()
+        if not self._clients:
+            return
+        self.cache.update(self.camera)
+        for client in self._clients[:]:
+            try:
+                self._service(client)
+            except OSError as error:
+                if error.errno != EAGAIN:
+                    self._close(client)
+
+    def _accept(self) -> None:
+        while len(self._clients) < self.max_clients:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError as error:
+                if error.errno == EAGAIN:
+                    return
+                raise
+            self._clients.append(_Client(sock))
+
+    def _close(self, client: _Client) -> None:
+        if client.slot >= 0:
+            self.cache.release(client.slot)
+            client.slot = -1
+        client.socket.close()
+        self._clients.remove(client)
+
+    def _service(self, client: _Client) -> None:
+        if client.state == _READING:
+            path = client.read_request()
+            if path is None:
+                return
+            client.route(path)
+        if not client.send():
+            return
+        if client.slot >= 0:
+            self.cache.release(client.slot)
+            client.slot = -1
+        if client.state == _CLOSING:
+            self._close(client)
+        elif client.sequence < self.cache.sequence:
+            self._queue_frame(client)
+            client.send()
+
+    def _queue_frame(self, client: _Client) -> None:
+        cache = self.cache
+        slot = cache.acquire()
+        if slot < 0:
+            return
+        frame = cache.frame(slot)
+        client.slot = slot
+        client.sequence = cache.sequence
+        if client.state == _SNAPSHOT:
+            client.state = _CLOSING
+            client.pending.append(memoryview((_SNAPSHOT_HEADER % len(frame)).encode()))
+            client.pending.append(frame)
+        else:
+            client.pending.append(memoryview((_PART_HEADER % len(frame)).encode()))
+            client.pending.append(frame)
+            client.pending.append(memoryview(_PART_TRAILER))
+
+
+class SimulatedCamera:
+    """A stand-in for the camera in JPEG mode, for running `MJPEGServer` on a
+    host computer.
+
+    Args:
+        frames (Sequence[bytes]): The JPEG images to capture, in turn.
+        fps (float): The rate at which frames become available, as `capture` \
+            waits for the next one like the camera does.
+    """
+
+    def __init__(self, frames: Sequence[bytes], fps: float = 15) -> None:
+        self._frames = frames
+        self._interval = 1 / fps
+        self._next_frame = 0
+        self._deadline = time.monotonic()
+
+    @property
+    def capture_buffer_size(self) -> int:
+        """The size of buffer needed for the largest frame"""
+        return max(len(frame) for frame in self._frames)
+
+    def capture(self, buf: WriteableBuffer) -> memoryview:
+        """Wait for the next frame, copy it into ``buf``, and return the part of
+        ``buf`` that holds it
+
+        Args:
+            buf (WriteableBuffer): The buffer to capture into
+        """
+        delay = self._deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._deadline = max(self._deadline, time.monotonic() - self._interval) + self._interval
+        frame = self._frames[self._next_frame]
+        self._next_frame = (self._next_frame + 1) % len(self._frames)
+        view = memoryview(buf)[: len(frame)]
+        view[:] = frame
+        return view
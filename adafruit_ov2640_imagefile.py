@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_imagefile`
+================================================================================
+
+Streaming writers for uncompressed image files: RGB565 BMP and 8-bit PGM.
+
+The header is written in one go when the writer is created, and the pixels
+are then written a band of rows at a time, so that an image captured with
+`adafruit_ov2640.OV2640.capture_strips` never needs to be in memory all at once.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import struct
+
+from adafruit_ov2640_convert import byteswap16, yuv_to_gray
+from adafruit_ov2640_sink import ChunkedSink, item_size
+
+try:
+    from typing import Any, Optional
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_BI_BITFIELDS = 3
+# BITMAPFILEHEADER followed by BITMAPV4HEADER
+_BMP_HEADER_SIZE = 14 + 108
+_BMP_GAMMA_OFFSET = _BMP_HEADER_SIZE - 12
+_GAMMA_2_2 = 144179
+_PIXELS_PER_METER_72DPI = 11811
+
+_masks_rgb565 = (0xF800, 0x7E0, 0x1F)
+_masks_bgr565 = (0x1F, 0x7E0, 0xF800)
+
+
+class _RowWriter:
+    def __init__(
+        self, file: Any, header: ReadableBuffer, row_bytes: int, stride: int, height: int
+    ) -> None:
+        self._file = file
+        self._header_size = len(header)
+        self._row_bytes = row_bytes
+        self._stride = stride
+        self._height = height
+        self._next_row = 0
+        self._sink = ChunkedSink()
+        self._padding = bytes(stride - row_bytes)
+        file.write(header)
+
+    @property
+    def rows_written(self) -> int:
+        """The row after the last one written"""
+        return self._next_row
+
+    def write_rows(self, data: ReadableBuffer, row: Optional[int] = None) -> None:
+        """Write one or more whole rows of pixels.
+
+        The arguments match the callback of
+        `adafruit_ov2640.OV2640.capture_strips`, so this method can be passed to
+        it directly.
+
+        Args:
+            data (ReadableBuffer): The rows, as captured
+            row (Optional[int]): The image row that ``data`` starts at, or None \
+                to follow the rows last written
+        """
+        if row is not None and row != self._next_row:
+            self._file.seek(self._header_size + row * self._stride)
+            self._next_row = row
+        # The memoryview of a 16-bit displayio.Bitmap indexes whole pixels, so
+        # rows are counted in bytes and sliced in items
+        view = memoryview(data)
+        size = item_size(view)
+        row_items = self._input_row_bytes() // size
+        rows = len(view) // row_items
+        if self._next_row + rows > self._height:
+            raise ValueError("Too many rows")
+        if self._padding:
+            for i in range(rows):
+                self._write(view[i * row_items : (i + 1) * row_items])
+                self._file.write(self._padding)
+        else:
+            self._write(view[: rows * row_items])
+        self._next_row += rows
+
+    def write(self, data: ReadableBuffer) -> None:
+        """Write a whole image, such as the buffer passed to
+        `adafruit_ov2640.OV2640.capture`
+
+        Args:
+            data (ReadableBuffer): The image
+        """
+        self.write_rows(data, 0)
+
+    def _input_row_bytes(self) -> int:
+        return self._row_bytes
+
+    def _write(self, data: memoryview) -> None:
+        self._sink.write(self._file, data)
+
+
+class BMPWriter(_RowWriter):
+    """Write an RGB565 image to a BMP file.
+
+    The file uses ``BI_BITFIELDS`` color masks, so the pixels are stored exactly
+    as the camera captures them, as RGB565 or BGR565, and rows are stored top
+    to bottom in capture order.  BMP pixels are little endian: capture with
+    ``byte_order`` set to ``OV2640_BYTE_ORDER_LITTLE_ENDIAN``, or pass ``swap`` to
+    swap the bytes of each band as it is written.
+
+    Args:
+        file: The file to write to, opened for writing in binary mode.
+        width (int): The width of the image.
+        height (int): The height of the image.
+        bgr (bool): The pixels are BGR565, as shown by ``displayio`` with \
+            ``Colorspace.BGR565``, rather than RGB565.
+        swap (bool): The pixels are big endian and must be swapped.
+        chunk_size (int): The size of the scratch buffer used for swapping.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        width: int,
+        height: int,
+        bgr: bool = False,
+        swap: bool = False,
+        chunk_size: int = 2048,
+    ) -> None:
+        row_bytes = 2 * width
+        stride = (row_bytes + 3) & ~3
+        header = bytearray(_BMP_HEADER_SIZE)
+        red, green, blue = _masks_bgr565 if bgr else _masks_rgb565
+        struct.pack_into(
+            "<2sIHHIIiiHHIIiiIIIIIII",
+            header,
+            0,
+            b"BM",
+            _BMP_HEADER_SIZE + stride * height,  # file size
+            0,  # reserved
+            0,  # reserved
+            _BMP_HEADER_SIZE,  # offset of the pixels
+            108,  # size of BITMAPV4HEADER
+            width,
+            -height,  # negative for rows from the top down
+            1,  # color planes
+            16,  # bits per pixel
+            _BI_BITFIELDS,
+            stride * height,  # size of the pixels
+            _PIXELS_PER_METER_72DPI,
+            _PIXELS_PER_METER_72DPI,
+            0,  # palette size
+            0,  # important colors
+            red,
+            green,
+            blue,
+            0,  # alpha mask
+            0,  # color space type, followed by the CIEXYZ endpoints (all 0)
+        )
+        struct.pack_into("<III", header, _BMP_GAMMA_OFFSET, _GAMMA_2_2, _GAMMA_2_2, _GAMMA_2_2)
+        self._scratch = bytearray(chunk_size & ~1) if swap else None
+        super().__init__(file, header, row_bytes, stride, height)
+
+    def _write(self, data: memoryview) -> None:
+        scratch = self._scratch
+        if scratch is None:
+            super()._write(data)
+            return
+        size = item_size(data)
+        chunk_items = len(scratch) // size
+        view = memoryview(scratch)
+        for start in range(0, len(data), chunk_items):
+            chunk = data[start : start + chunk_items]
+            swapped = view[: len(chunk) * size]
+            byteswap16(chunk, swapped)
+            self._file.write(swapped)
+
+
+class PGMWriter(_RowWriter):
+    """Write an 8-bit grayscale image to a binary PGM file.
+
+    The image can be a grayscale plane, such as one produced by
+    `adafruit_ov2640_convert.yuv_to_luma`, or a YUV422 capture, from which the
+    luma (Y) bytes are extracted a chunk at a time as they are written.
+
+    Args:
+        file: The file to write to, opened for writing in binary mode.
+        width (int): The width of the image.
+        height (int): The height of the image.
+        yuv (bool): The rows written are YUV422, rather than 8-bit grayscale.
+        byte_order (int): The byte order of YUV422 rows, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants.
+        chunk_size (int): The size of the scratch buffer used for YUV422.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        width: int,
+        height: int,
+        yuv: bool = False,
+        byte_order: int = 0,
+        chunk_size: int = 2048,
+    ) -> None:
+        self._yuv = yuv
+        self._byte_order = byte_order
+        self._scratch = bytearray(chunk_size // 2) if yuv else None
+        header = f"P5\n{width} {height}\n255\n".encode()
+        super().__init__(file, header, width, width, height)
+
+    def _input_row_bytes(self) -> int:
+        return 2 * self._row_bytes if self._yuv else self._row_bytes
+
+    def _write(self, data: memoryview) -> None:
+        scratch = self._scratch
+        if scratch is None:
+            super()._write(data)
+            return
+        chunk_size = 2 * len(scratch)
+        view = memoryview(scratch)
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start : start + chunk_size]
+            gray = view[: len(chunk) // 2]
+            yuv_to_gray(chunk, gray, self._byte_order)
+            self._file.write(gray)
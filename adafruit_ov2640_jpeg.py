@@ -0,0 +1,698 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_jpeg`
+================================================================================
+
+Inspection of the JPEG images captured by the OV2640, without decoding them.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+from array import array
+
+try:
+    from typing import Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+_SOF0 = 0xC0
+_SOF1 = 0xC1
+_SOF2 = 0xC2
+_DHT = 0xC4
+_RST0 = 0xD0
+_RST7 = 0xD7
+_SOI = 0xD8
+_EOI = 0xD9
+_SOS = 0xDA
+_DQT = 0xDB
+_DRI = 0xDD
+
+# The IJG (libjpeg) luminance quantization table at quality 50, which other
+# qualities scale
+_STANDARD_LUMINANCE_TOTAL = sum(
+    (
+        16, 11, 10, 16, 24, 40, 51, 61, 12, 12, 14, 19, 26, 58, 60, 55,
+        14, 13, 16, 24, 40, 57, 69, 56, 14, 17, 22, 29, 51, 87, 80, 62,
+        18, 22, 37, 56, 68, 109, 103, 77, 24, 35, 55, 64, 81, 104, 113, 92,
+        49, 64, 78, 87, 103, 121, 120, 101, 72, 92, 95, 98, 112, 100, 103, 99,
+    )
+)  # fmt: skip
+
+
+def _find_marker(buf: ReadableBuffer, start: int, end: int) -> int:
+    # The offset of the next 0xFF byte, using find() where the buffer has it
+    # (bytearray and bytes do, memoryview does not)
+    find = getattr(buf, "find", None)
+    if find is not None:
+        return find(b"\xff", start, end)
+    for i in range(start, end):
+        if buf[i] == 0xFF:
+            return i
+    return -1
+
+
+class JPEGHeader:
+    """The header of a JPEG image, parsed in place in the capture buffer.
+
+    The markers from SOI up to SOS are walked without copying any data, and
+    the parser can be reused for every frame.
+    Tables are recorded as offsets into the buffer.  If the image is not a
+    well formed baseline or progressive JPEG, ending in EOI, `valid` is False
+    and `error` says why.
+
+    Args:
+        buf (Optional[ReadableBuffer]): The JPEG data to `parse`, if any.
+        length (Optional[int]): The length of the JPEG data in ``buf``, or \
+            None for all of it.
+    """
+
+    __slots__ = (
+        "component_ids",
+        "components",
+        "error",
+        "height",
+        "huffman_tables",
+        "progressive",
+        "quality",
+        "quantization",
+        "quantization_tables",
+        "restart_interval",
+        "sampling",
+        "scan_offset",
+        "scan_tables",
+        "valid",
+        "width",
+    )
+
+    def __init__(self, buf: Optional[ReadableBuffer] = None, length: Optional[int] = None) -> None:
+        self.valid = False
+        """True if the last image parsed is a well formed JPEG"""
+        self.error = None
+        """Why the last image parsed is not valid, or None"""
+        self.width = 0
+        """The width of the image in pixels"""
+        self.height = 0
+        """The height of the image in pixels"""
+        self.components = 0
+        """The number of color components, 1 for grayscale or 3 for YCbCr"""
+        self.component_ids = bytearray(4)
+        """The identifier of each component, as used by the scan"""
+        self.sampling = bytearray(4)
+        """The sampling factors of each component, horizontal in the high 4 bits
+        and vertical in the low 4 bits.  The OV2640's 4:2:2 JPEGs have 0x21,
+        0x11, 0x11."""
+        self.quantization = bytearray(4)
+        """The quantization table used by each component"""
+        self.quantization_tables = array("L", (0, 0, 0, 0))
+        """The offset in the buffer of each of the 4 quantization tables, in
+        zigzag order, or 0 if the table is not defined"""
+        self.huffman_tables = array("L", (0, 0, 0, 0, 0, 0, 0, 0))
+        """The offset in the buffer of each Huffman table, starting with its 16
+        code length counts, or 0 if the table is not defined.  The DC tables
+        come first, then the AC tables."""
+        self.scan_tables = bytearray(4)
+        """The Huffman tables used by each component in the first scan, DC in
+        the high 4 bits and AC in the low 4 bits"""
+        self.restart_interval = 0
+        """The number of MCUs between restart markers, or 0 if there are none"""
+        self.scan_offset = 0
+        """The offset in the buffer of the entropy-coded data of the first scan"""
+        self.progressive = False
+        """True if the image is progressive rather than baseline"""
+        self.quality = 0
+        """The IJG quality setting, from 1 to 100, that the luminance
+        quantization table corresponds to, or 0 if it is unknown"""
+        if buf is not None:
+            self.parse(buf, length)
+
+    @property
+    def mcu_width(self) -> int:
+        """The width of each MCU (minimum coded unit) in pixels"""
+        return 8 * max(s >> 4 for s in self.sampling[: self.components])
+
+    @property
+    def mcu_height(self) -> int:
+        """The height of each MCU (minimum coded unit) in pixels"""
+        return 8 * max(s & 0xF for s in self.sampling[: self.components])
+
+    @property
+    def mcus(self) -> int:
+        """The number of MCUs (minimum coded units) in the image"""
+        mcu_width = self.mcu_width
+        mcu_height = self.mcu_height
+        return ((self.width + mcu_width - 1) // mcu_width) * (
+            (self.height + mcu_height - 1) // mcu_height
+        )
+
+    def parse(self, buf: ReadableBuffer, length: Optional[int] = None) -> bool:
+        """Parse the header of a JPEG image, and return `valid`.
+
+        Args:
+            buf (ReadableBuffer): The JPEG data, such as the `memoryview` returned \
+                by `adafruit_ov2640.OV2640.capture`.
+            length (Optional[int]): The length of the JPEG data in ``buf``, or \
+                None for all of it.
+        """
+        if length is None:
+            length = len(buf)
+        try:
+            self._parse(buf, length)
+        except ValueError as error:
+            self.valid = False
+            self.error = str(error)
+            return False
+        self.valid = True
+        self.error = None
+        return True
+
+    def _parse(self, buf: ReadableBuffer, length: int) -> None:
+        self.valid = False
+        self.components = 0
+        self.restart_interval = 0
+        self.scan_offset = 0
+        self.quality = 0
+        quantization_tables = self.quantization_tables
+        huffman_tables = self.huffman_tables
+        for i in range(4):
+            quantization_tables[i] = 0
+        for i in range(8):
+            huffman_tables[i] = 0
+
+        if length < 4 or buf[0] != 0xFF or buf[1] != _SOI:
+            raise ValueError("No SOI marker")
+        if buf[length - 2] != 0xFF or buf[length - 1] != _EOI:
+            raise ValueError("No EOI marker")
+        offset = 2
+        while True:
+            if offset + 4 > length:
+                raise ValueError("No SOS marker")
+            if buf[offset] != 0xFF:
+                raise ValueError(f"Bad marker at {offset}")
+            marker = buf[offset + 1]
+            if marker == 0xFF:
+                # Fill byte
+                offset += 1
+                continue
+            end = offset + 2 + ((buf[offset + 2] << 8) | buf[offset + 3])
+            if end > length:
+                raise ValueError(f"Truncated segment at {offset}")
+            start = offset + 4
+            if marker == _DQT:
+                while start < end:
+                    table = buf[start]
+                    quantization_tables[table & 3] = start + 1
+                    start += 65 + 64 * (table >> 4)
+                if start > end:
+                    raise ValueError(f"Truncated quantization table at {offset}")
+            elif marker == _DHT:
+                while start + 17 <= end:
+                    table = buf[start]
+                    huffman_tables[(table >> 2) & 4 | table & 3] = start + 1
+                    start += 17 + _check_huffman_counts(buf, start + 1)
+                if start > end:
+                    raise ValueError(f"Truncated Huffman table at {offset}")
+            elif marker == _DRI:
+                if start + 2 > end:
+                    raise ValueError(f"Truncated restart interval at {offset}")
+                self.restart_interval = (buf[start] << 8) | buf[start + 1]
+            elif marker in {_SOF0, _SOF1, _SOF2}:
+                if start + 6 > end or start + 6 + 3 * buf[start + 5] > end:
+                    raise ValueError(f"Truncated frame header at {offset}")
+                self.progressive = marker == _SOF2
+                self.height = (buf[start + 1] << 8) | buf[start + 2]
+                self.width = (buf[start + 3] << 8) | buf[start + 4]
+                components = buf[start + 5]
+                if not 1 <= components <= 4:
+                    raise ValueError(f"{components} components")
+                for i in range(components):
+                    component = start + 6 + 3 * i
+                    self.component_ids[i] = buf[component]
+                    self.sampling[i] = buf[component + 1]
+                    self.quantization[i] = buf[component + 2] & 3
+                self.components = components
+            elif _SOF0 <= marker <= 0xCF and marker not in {_DHT, 0xC8, 0xCC}:
+                raise ValueError(f"Unsupported SOF{marker - _SOF0}")
+            elif marker == _SOS:
+                break
+            offset = end
+
+        if not self.components:
+            raise ValueError("No SOF marker")
+        if not self.width or not self.height:
+            raise ValueError("No image size")
+        if start >= end or start + 1 + 2 * buf[start] > end:
+            raise ValueError(f"Truncated scan header at {offset}")
+        for i in range(buf[start]):
+            component_id = buf[start + 1 + 2 * i]
+            for j in range(self.components):
+                if self.component_ids[j] == component_id:
+                    self.scan_tables[j] = buf[start + 2 + 2 * i]
+        for i in range(self.components):
+            if not quantization_tables[self.quantization[i]]:
+                raise ValueError(f"Missing quantization table {self.quantization[i]}")
+            tables = self.scan_tables[i]
+            if not self.progressive and (
+                not huffman_tables[tables >> 4 & 3] or not huffman_tables[4 | tables & 3]
+            ):
+                raise ValueError(f"Missing Huffman table for component {i}")
+        self.scan_offset = end
+        self.quality = self._estimate_quality(buf)
+
+    def _estimate_quality(self, buf: ReadableBuffer) -> int:
+        # Invert the IJG scaling of the standard table, from the total of the
+        # luminance table's entries
+        offset = self.quantization_tables[self.quantization[0]]
+        if buf[offset - 1] >> 4:
+            # 16 bit entries are only used at very low quality
+            total = sum((buf[offset + 2 * i] << 8) | buf[offset + 2 * i + 1] for i in range(64))
+        else:
+            total = sum(buf[offset : offset + 64])
+        scale = total * 100 / _STANDARD_LUMINANCE_TOTAL
+        if scale <= 100:
+            quality = (200 - scale) / 2
+        else:
+            quality = 5000 / scale
+        return min(max(round(quality), 1), 100)
+
+
+class JPEGChangeDetector:
+    """Detect change between JPEG frames from the sizes of their compressed data.
+
+    The amount of entropy-coded data a region of the image needs grows with its
+    detail, so when something moves the sizes change where it moved.  If the
+    JPEG has restart markers (a DRI segment), the scan data is split at them
+    into ``bands`` horizontal bands whose sizes form the signature of the
+    frame.  Otherwise, the signature is just the total size of the JPEG.
+    Nothing is decoded, and the only memory used is the two signature arrays.
+
+    Args:
+        bands (int): The number of bands to divide the image into.
+        threshold (float): The `score` at which `update` reports a change.
+    """
+
+    def __init__(self, bands: int = 16, threshold: float = 0.05) -> None:
+        self.threshold = threshold
+        self._signature = array("L", [0] * bands)
+        self._previous = array("L", [0] * bands)
+        self._has_previous = False
+        self._restart_markers = False
+        self._score = 0.0
+        self._header = JPEGHeader()
+
+    @property
+    def signature(self) -> array:
+        """The size in bytes of each band of the last frame"""
+        return self._signature
+
+    @property
+    def restart_markers(self) -> bool:
+        """True if the last frame had restart markers, so that its signature
+        covers individual bands rather than the whole image"""
+        return self._restart_markers
+
+    @property
+    def score(self) -> float:
+        """The change between the last two frames, as the largest change in the
+        size of any band relative to its size in the earlier frame"""
+        return self._score
+
+    def reset(self) -> None:
+        """Forget the previous frame, so that the next one is not compared"""
+        self._has_previous = False
+        self._score = 0.0
+
+    def update(self, buf: ReadableBuffer, length: Optional[int] = None) -> bool:
+        """Compute the signature of a JPEG frame, compare it with the previous
+        frame, and return True if `score` is at least ``threshold``.
+
+        Searching for markers is much faster in a `bytearray` than in a
+        `memoryview`, so rather than the `memoryview` returned by
+        `adafruit_ov2640.OV2640.capture`, pass the underlying buffer (such as
+        ``cam.buffer_pool.buffer``) along with the length of the JPEG data.
+
+        Raises `ValueError` if the frame is not a valid JPEG, as checked by
+        `JPEGHeader`.
+
+        Args:
+            buf (ReadableBuffer): The JPEG data.
+            length (Optional[int]): The length of the JPEG data in ``buf``, or \
+                None for all of it.
+        """
+        if length is None:
+            length = len(buf)
+        header = self._header
+        if not header.parse(buf, length):
+            raise ValueError(header.error)
+        self._previous, self._signature = self._signature, self._previous
+        signature = self._signature
+        bands = len(signature)
+        for i in range(bands):
+            signature[i] = 0
+
+        interval = header.restart_interval
+        self._restart_markers = bool(interval)
+        if interval:
+            offset = header.scan_offset
+            segments = (header.mcus + interval - 1) // interval
+            segment = 0
+            start = offset
+            while True:
+                offset = _find_marker(buf, offset, length - 1)
+                if offset == -1:
+                    offset = length
+                    break
+                marker = buf[offset + 1]
+                if _RST0 <= marker <= _RST7:
+                    signature[min(segment * bands // segments, bands - 1)] += offset - start
+                    segment += 1
+                    start = offset + 2
+                elif marker == _EOI:
+                    break
+                # Skip stuffed zeros, but not a fill byte followed by a marker
+                offset += 1 if marker == 0xFF else 2
+            signature[min(segment * bands // segments, bands - 1)] += offset - start
+        else:
+            signature[0] = length
+
+        if not self._has_previous:
+            self._has_previous = True
+            self._score = 0.0
+            return False
+        previous = self._previous
+        score = 0.0
+        for i in range(bands):
+            if previous[i]:
+                score = max(score, abs(signature[i] - previous[i]) / previous[i])
+        self._score = score
+        return self._score >= self.threshold
+
+
+def _check_huffman_counts(buf: ReadableBuffer, offset: int) -> int:
+    # Check that the 16 code counts at offset fit the code space of a
+    # canonical Huffman code, and return the number of values
+    code = 0
+    total = 0
+    for length in range(1, 17):
+        count = buf[offset + length - 1]
+        code += count
+        total += count
+        if code > 1 << length:
+            raise ValueError(f"Bad Huffman table at {offset - 1}")
+        code <<= 1
+    return total
+
+
+class _HuffmanTable:
+    # A canonical Huffman table, with an 8-bit lookahead for the short codes
+    # that make up most of the data, and the JPEG standard's maxcode / valptr
+    # arrays for the rest
+
+    __slots__ = ("lookup", "maxcode", "offset", "values")
+
+    def __init__(self, buf: ReadableBuffer, offset: int) -> None:
+        self.lookup = array("H", bytes(512))
+        self.maxcode = [-1] * 17
+        self.offset = [0] * 17
+        self.values = memoryview(buf)[offset + 16 :]
+        code = 0
+        index = 0
+        for length in range(1, 17):
+            count = buf[offset + length - 1]
+            if count:
+                self.offset[length] = index - code
+                self.maxcode[length] = code + count - 1
+            for _ in range(count):
+                if length <= 8:
+                    shift = 8 - length
+                    entry = (length << 8) | self.values[index]
+                    for i in range(code << shift, (code + 1) << shift):
+                        self.lookup[i] = entry
+                code += 1
+                index += 1
+            code <<= 1
+
+
+class _BitReader:
+    # Reads the entropy-coded data of a scan, removing stuffed zero bytes and
+    # stopping at markers
+
+    __slots__ = ("bits", "buf", "count", "end", "position")
+
+    def __init__(self, buf: ReadableBuffer, position: int, end: int) -> None:
+        self.buf = buf
+        self.position = position
+        self.end = end
+        self.bits = 0
+        self.count = 0
+
+    def fill(self) -> None:
+        buf = self.buf
+        position = self.position
+        bits = self.bits
+        count = self.count
+        # Stop at 24 bits, which leaves at least 16 for decode() while keeping
+        # the bits in a small int
+        while count <= 16:
+            byte = 0
+            if position < self.end:
+                byte = buf[position]
+                if byte != 0xFF:
+                    position += 1
+                elif buf[position + 1] == 0:
+                    position += 2
+                else:
+                    # A marker; leave it to restart() and feed zeros
+                    byte = 0
+            bits = (bits << 8) | byte
+            count += 8
+        self.position = position
+        self.bits = bits
+        self.count = count
+
+    def receive(self, length: int) -> int:
+        if self.count < length:
+            self.fill()
+        count = self.count - length
+        value = self.bits >> count
+        self.bits &= (1 << count) - 1
+        self.count = count
+        return value
+
+    def decode(self, table: _HuffmanTable) -> int:
+        if self.count < 16:
+            self.fill()
+        count = self.count
+        bits = self.bits
+        entry = table.lookup[bits >> (count - 8)]
+        if entry:
+            length = entry >> 8
+        else:
+            length = 9
+            while bits >> (count - length) > table.maxcode[length]:
+                length += 1
+                if length > 16:
+                    raise ValueError("Bad Huffman code")
+            entry = table.values[table.offset[length] + (bits >> (count - length))]
+        count -= length
+        self.bits &= (1 << count) - 1
+        self.count = count
+        return entry & 0xFF
+
+    def block(self, dc_table: _HuffmanTable, ac_table: _HuffmanTable) -> int:
+        # Decode the DC difference of a block, and skip its AC coefficients
+        size = self.decode(dc_table)
+        difference = 0
+        if size:
+            difference = self.receive(size)
+            if difference < 1 << (size - 1):
+                difference -= (1 << size) - 1
+        k = 1
+        while k < 64:
+            symbol = self.decode(ac_table)
+            size = symbol & 0xF
+            if size:
+                self.receive(size)
+                k += (symbol >> 4) + 1
+            elif symbol == 0xF0:
+                k += 16
+            else:
+                break
+        return difference
+
+    def restart(self) -> None:
+        buf = self.buf
+        position = self.position
+        if (
+            position + 1 >= self.end
+            or buf[position] != 0xFF
+            or not _RST0 <= buf[position + 1] <= _RST7
+        ):
+            raise ValueError(f"Missing restart marker at {position}")
+        self.position = position + 2
+        self.bits = 0
+        self.count = 0
+
+
+class _ThumbnailDecoder:
+    # Decodes the DC values of one MCU at a time
+
+    __slots__ = (
+        "chroma",
+        "color",
+        "components",
+        "height",
+        "layout",
+        "luma",
+        "luma_h",
+        "luma_v",
+        "mcu_columns",
+        "predictors",
+        "reader",
+        "width",
+    )
+
+    def __init__(self, buf: ReadableBuffer, header: JPEGHeader, length: int) -> None:
+        # Per component: its block count, DC and AC tables, and DC quantizer
+        self.layout = []
+        for i in range(header.components):
+            sampling = header.sampling[i]
+            tables = header.scan_tables[i]
+            quantizer = header.quantization_tables[header.quantization[i]]
+            dc_quantizer = buf[quantizer]
+            if buf[quantizer - 1] >> 4:
+                dc_quantizer = (dc_quantizer << 8) | buf[quantizer + 1]
+            self.layout.append(
+                (
+                    (sampling >> 4) * (sampling & 0xF),
+                    _HuffmanTable(buf, header.huffman_tables[tables >> 4 & 3]),
+                    _HuffmanTable(buf, header.huffman_tables[4 | tables & 3]),
+                    dc_quantizer,
+                )
+            )
+        self.components = header.components
+        self.predictors = [0] * header.components
+        # The value of each luma block in the MCU, and the centered value of
+        # each chroma component
+        self.luma = [0] * self.layout[0][0]
+        self.chroma = [0, 0, 0]
+        self.reader = _BitReader(buf, header.scan_offset, length)
+        self.color = header.components == 3
+        self.width = (header.width + 7) // 8
+        self.height = (header.height + 7) // 8
+        self.luma_h = header.sampling[0] >> 4
+        self.luma_v = header.sampling[0] & 0xF
+        self.mcu_columns = (header.width + header.mcu_width - 1) // header.mcu_width
+
+    def restart(self) -> None:
+        self.reader.restart()
+        for i in range(self.components):
+            self.predictors[i] = 0
+
+    def decode_mcu(self) -> None:
+        reader = self.reader
+        predictors = self.predictors
+        for i in range(self.components):
+            blocks, dc_table, ac_table, quantizer = self.layout[i]
+            for block in range(blocks):
+                predictors[i] += reader.block(dc_table, ac_table)
+                # The DC coefficient is 8 times the average of the block
+                value = (predictors[i] * quantizer + 4) >> 3
+                if i == 0:
+                    self.luma[block] = min(max(value + 128, 0), 255)
+                else:
+                    self.chroma[i] = value
+
+    def store(self, dest: WriteableBuffer, mcu: int, gray: bool, dest_byte_order: int) -> None:
+        luma = self.luma
+        luma_h = self.luma_h
+        width = self.width
+        red = green = blue = 0
+        if self.color and not gray:
+            chroma = self.chroma
+            red = chroma[2] * 90
+            green = chroma[1] * -22 - chroma[2] * 46
+            blue = chroma[1] * 113
+        for block in range(luma_h * self.luma_v):
+            x = mcu % self.mcu_columns * luma_h + block % luma_h
+            y = mcu // self.mcu_columns * self.luma_v + block // luma_h
+            if x >= width or y >= self.height:
+                continue
+            index = y * width + x
+            if gray:
+                dest[index] = luma[block]
+                continue
+            value = luma[block] * 64
+            r = min(max(value + red, 0), 16383) >> 9
+            g = min(max(value + green, 0), 16383) >> 8
+            b = min(max(value + blue, 0), 16383) >> 9
+            dest[2 * index + dest_byte_order] = (r << 3) | (g >> 3)
+            dest[2 * index + 1 - dest_byte_order] = ((g << 5) | b) & 0xFF
+
+
+def decode_thumbnail(
+    buf: ReadableBuffer,
+    dest: WriteableBuffer,
+    length: Optional[int] = None,
+    gray: bool = False,
+    dest_byte_order: int = 1,
+    header: Optional[JPEGHeader] = None,
+) -> Tuple[int, int]:
+    """Decode a baseline JPEG at 1/8 scale, and return the size of the result.
+
+    Only the DC coefficient of each 8x8 block is decoded, which is the block's
+    average, so each block becomes one pixel.  The AC coefficients are skipped
+    without being dequantized or transformed, and no full-size buffer is needed:
+    a UXGA JPEG becomes a 200x150 thumbnail.  ``dest`` must hold
+    ``((width + 7) // 8) * ((height + 7) // 8)`` pixels, each 1 byte if ``gray``
+    or 2 bytes of RGB565 otherwise.  Any sampling factors (including the
+    OV2640's 4:2:2) and restart markers are supported; progressive JPEGs are
+    not.
+
+    Args:
+        buf (ReadableBuffer): The JPEG data.
+        dest (WriteableBuffer): The thumbnail.
+        length (Optional[int]): The length of the JPEG data in ``buf``, or \
+            None for all of it.
+        gray (bool): Produce an 8-bit grayscale thumbnail rather than RGB565.
+        dest_byte_order (int): The byte order of the RGB565 thumbnail, one of \
+            the ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants.  The default, \
+            little endian, is displayio's ``Colorspace.RGB565``.
+        header (Optional[JPEGHeader]): The already parsed header of ``buf``, \
+            to avoid parsing it again.
+    """
+    if length is None:
+        length = len(buf)
+    if header is None:
+        header = JPEGHeader()
+        header.parse(buf, length)
+    if not header.valid:
+        raise ValueError(header.error)
+    if header.progressive:
+        raise ValueError("Progressive JPEG is not supported")
+    size = ((header.width + 7) // 8) * ((header.height + 7) // 8) * (1 if gray else 2)
+    if len(dest) < size:
+        raise ValueError(f"Buffer is too small for the thumbnail, which needs {size} bytes")
+
+    decoder = _ThumbnailDecoder(buf, header, length)
+    interval = header.restart_interval
+    for mcu in range(header.mcus):
+        if interval and mcu and mcu % interval == 0:
+            decoder.restart()
+        decoder.decode_mcu()
+        decoder.store(dest, mcu, gray, dest_byte_order)
+    return decoder.width, decoder.height
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_motion`
+================================================================================
+
+Motion detection for the OV2640, to gate still capture on a change in the scene.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware with ulab, or CPython with NumPy
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    import numpy as np
+
+from adafruit_ov2640 import OV2640_COLOR_JPEG, OV2640_COLOR_YUV, OV2640_SIZE_96X96
+from adafruit_ov2640_convert import yuv_to_luma
+
+try:
+    from typing import Optional
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_ov2640 import OV2640
+except ImportError:
+    pass
+
+# ulab's floating point dtype; NumPy accepts Python's float
+_float = getattr(np, "float", float)
+
+
+class MotionDetector:
+    """Detect change in the scene from small YUV frames, and capture stills only
+    when something has changed.
+
+    The sensor's DSP scales each detection frame down to ``size``, and the luma
+    of each ``block`` x ``block`` block of it is averaged into an array of a few
+    hundred values.  A running average of these is kept as the background, and a
+    block has changed when it differs from the background by more than
+    ``threshold``.  The detector takes over the camera: creating it switches the
+    camera to ``size`` in YUV, and turns on `adafruit_ov2640.OV2640.exposure_transfer`
+    so that switching to and from the still mode keeps the exposure.
+
+    Args:
+        camera (OV2640): The camera to use.
+        size (int): The detection frame size, one of the ``OV2640_SIZE_`` \
+            constants.  The smallest sizes, 96x96 and QQVGA, are fastest.
+        block (int): The size in pixels of each block, 2, 4 or 8.
+        threshold (int): The change in average luma, out of 255, at which a block \
+            has changed.
+        min_score (float): The fraction of blocks that must change for `update` \
+            to report motion.
+        learning_rate (float): The fraction of each frame blended into the \
+            background, from 0 to 1.  Lower values detect slower movement.
+        compensate (bool): Subtract the median change over all blocks before \
+            comparing, so that a change of exposure or lighting is not motion.
+    """
+
+    def __init__(
+        self,
+        camera: "OV2640",
+        size: int = OV2640_SIZE_96X96,
+        block: int = 8,
+        threshold: int = 16,
+        min_score: float = 0.02,
+        learning_rate: float = 0.05,
+        compensate: bool = True,
+    ) -> None:
+        self._camera = camera
+        self._size = size
+        self._block = block
+        self.threshold = threshold
+        self.min_score = min_score
+        self.learning_rate = learning_rate
+        self.compensate = compensate
+        camera.exposure_transfer = True
+        camera.size = size
+        camera.colorspace = OV2640_COLOR_YUV
+        self._width = camera.width
+        self._height = camera.height
+        self._frame = bytearray(camera.capture_buffer_size)
+        rows = self._height // block
+        columns = self._width // block
+        self._luma = bytearray(rows * columns)
+        self._blocks = np.frombuffer(self._luma, dtype=np.uint8).reshape((rows, columns))
+        self._background = None
+        self._mask = None
+        self._score = 0.0
+        camera.settle(self._frame)
+
+    @property
+    def mask(self):
+        """The blocks that changed in the last frame, as a boolean array of one
+        element per block, or None before the second frame"""
+        return self._mask
+
+    @property
+    def score(self) -> float:
+        """The fraction of blocks that changed in the last frame, from 0 to 1"""
+        return self._score
+
+    def reset(self) -> None:
+        """Forget the background, so that the next frame becomes the new background"""
+        self._background = None
+        self._mask = None
+        self._score = 0.0
+
+    def update(self) -> bool:
+        """Capture a detection frame, compare it with the background, and return
+        True if at least ``min_score`` of the blocks changed.
+
+        If the camera was switched to another mode (for example by
+        `capture_still`), it is switched back and allowed to settle first."""
+        camera = self._camera
+        if camera.size != self._size or camera.colorspace != OV2640_COLOR_YUV:
+            camera.size = self._size
+            camera.colorspace = OV2640_COLOR_YUV
+            camera.settle(self._frame)
+        camera.capture(self._frame)
+        yuv_to_luma(
+            self._frame,
+            self._width,
+            self._height,
+            self._luma,
+            scale=self._block,
+            byte_order=camera.byte_order,
+        )
+        current = np.array(self._blocks, dtype=_float)
+        if self._background is None:
+            self._background = current
+            return False
+        difference = current - self._background
+        self._background += self.learning_rate * difference
+        if self.compensate:
+            # The median, unlike the mean, is not pulled along by the moving
+            # object itself as long as it covers less than half the frame
+            difference -= np.median(difference)
+        self._mask = abs(difference) > self.threshold
+        self._score = np.sum(self._mask) / self._mask.size
+        return self._score >= self.min_score
+
+    def capture_still(
+        self,
+        size: int,
+        colorspace: int = OV2640_COLOR_JPEG,
+        buf: Optional[WriteableBuffer] = None,
+    ) -> memoryview:
+        """Switch the camera to a still mode and capture one image.
+
+        The camera stays in the still mode, so that several stills can be taken;
+        the next `update` switches it back.
+
+        Args:
+            size (int): The still size, one of the ``OV2640_SIZE_`` constants.
+            colorspace (int): The still colorspace, one of the ``OV2640_COLOR_`` \
+                constants.
+            buf (Optional[WriteableBuffer]): The buffer to capture into, or None \
+                to use the camera's buffer pool.
+        """
+        camera = self._camera
+        camera.size = size
+        camera.colorspace = colorspace
+        camera.settle(buf)
+        result = camera.capture(buf)
+        if result is None:
+            return memoryview(buf)
+        return result
+
+    def capture_on_motion(
+        self,
+        size: int,
+        colorspace: int = OV2640_COLOR_JPEG,
+        buf: Optional[WriteableBuffer] = None,
+    ) -> Optional[memoryview]:
+        """Call `update`, and if it detects motion, return `capture_still`.
+        Otherwise return None.
+
+        Args:
+            size (int): The still size, one of the ``OV2640_SIZE_`` constants.
+            colorspace (int): The still colorspace, one of the ``OV2640_COLOR_`` \
+                constants.
+            buf (Optional[WriteableBuffer]): The buffer to capture into, or None \
+                to use the camera's buffer pool.
+        """
+        if self.update():
+            return self.capture_still(size, colorspace, buf)
+        return None
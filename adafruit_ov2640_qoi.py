@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_qoi`
+================================================================================
+
+Lossless compression of RGB565 images, in the style of the QOI ("Quite OK
+Image") format adapted to 16-bit pixels.
+
+Each pixel is coded as a run of the previous pixel, a reference to one of the
+64 most recently seen colors, a small difference from the previous pixel, or
+failing those in full.  Images with flat areas and gentle gradients, such as
+the test pattern and most indoor scenes, shrink to a half to a quarter of
+their size, and encoding is a single pass with a small output buffer.
+
+The stream starts with a 14 byte header: the magic ``b"q565"``, the width and
+height as big endian 32-bit numbers, the bits per pixel (16) and a reserved 0
+byte.  It ends with seven 0 bytes and a 1.  The opcodes are those of QOI,
+with channels of 5, 6 and 5 bits:
+
+* ``00iiiiii``: the color at index ``i``, where the index of a color is \
+  ``(r * 3 + g * 5 + b * 7) % 64``
+* ``01rrggbb``: the previous color plus differences of -2 to 1 in each channel
+* ``10gggggg`` ``rrrrbbbb``: the previous color plus a green difference of -32 \
+  to 31, and red and blue differences of -8 to 7 relative to half the green one
+* ``11llllll``: the previous color repeated 1 to 62 times
+* ``11111110`` followed by the pixel, big endian
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import struct
+from array import array
+
+from adafruit_ov2640_sink import ChunkedSink, item_size
+
+try:
+    from typing import Any, Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_MAGIC = b"q565"
+_HEADER = ">4sIIBB"
+_HEADER_SIZE = 14
+_END = b"\0\0\0\0\0\0\0\1"
+
+_OP_INDEX = 0x00
+_OP_DIFF = 0x40
+_OP_LUMA = 0x80
+_OP_RUN = 0xC0
+_OP_PIXEL = 0xFE
+_MAX_RUN = 62
+
+
+class QOIEncoder:
+    """Compress an RGB565 image to ``target``, a band of rows at a time.
+
+    The compressed data is gathered in a buffer of ``chunk_size`` bytes, which is
+    written out each time it fills.  Only whole rows may be written, in order.
+
+    Args:
+        target: A file, socket or callable to write the compressed data to, \
+            as for `adafruit_ov2640_sink.ChunkedSink.write`.
+        width (int): The width of the image.
+        height (int): The height of the image.
+        byte_order (int): The byte order of the pixels, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants.
+        chunk_size (int): The size of the output buffer.
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        width: int,
+        height: int,
+        byte_order: int = 0,
+        chunk_size: int = 1024,
+    ) -> None:
+        if chunk_size < 16:
+            raise ValueError("chunk_size too small")
+        self._target = target
+        self._width = width
+        self._height = height
+        self._byte_order = byte_order
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+        self._position = 0
+        self._sink = ChunkedSink(chunk_size)
+        self._index = array("H", bytes(128))
+        self._previous = 0
+        self._run = 0
+        self._next_row = 0
+        self._length = 0
+        struct.pack_into(_HEADER, self._buffer, 0, _MAGIC, width, height, 16, 0)
+        self._position = _HEADER_SIZE
+
+    @property
+    def length(self) -> int:
+        """The number of compressed bytes written so far"""
+        return self._length + self._position
+
+    def _flush(self) -> None:
+        if self._position:
+            self._sink.write(self._target, self._view, self._position)
+            self._length += self._position
+            self._position = 0
+
+    def write_rows(self, data: ReadableBuffer, row: Optional[int] = None) -> None:
+        """Compress one or more whole rows of pixels.
+
+        The arguments match the callback of
+        `adafruit_ov2640.OV2640.capture_strips`, so this method can be passed to
+        it directly.
+
+        Args:
+            data (ReadableBuffer): The rows, as captured
+            row (Optional[int]): The image row that ``data`` starts at, which \
+                must follow the rows already written, or None
+        """
+        if row is not None and row != self._next_row:
+            raise ValueError(f"Expected row {self._next_row}")
+        # The memoryview of a 16-bit displayio.Bitmap indexes whole pixels, so
+        # rows are counted in bytes and pixels are read as whole items
+        view = memoryview(data)
+        size = item_size(view)
+        rows = len(view) * size // (2 * self._width)
+        if self._next_row + rows > self._height:
+            raise ValueError("Too many rows")
+        self._next_row += rows
+
+        # Runs are found here, and every other pixel is coded by _encode
+        buffer = self._buffer
+        limit = len(buffer) - 4
+        position = self._position
+        previous = self._previous
+        run = self._run
+        high = self._byte_order
+        for i in range(0, 2 * self._width * rows // size, 2 // size):
+            if size == 2:
+                # Items are little endian, as in memory
+                pixel = view[i]
+                if not high:
+                    pixel = (pixel & 0xFF) << 8 | pixel >> 8
+            else:
+                pixel = (view[i + high] << 8) | view[i + 1 - high]
+            if pixel == previous:
+                run += 1
+                if run < _MAX_RUN:
+                    continue
+            if position > limit:
+                self._position = position
+                self._flush()
+                position = 0
+            if run:
+                buffer[position] = _OP_RUN | (run - 1)
+                position += 1
+                if pixel == previous:
+                    run = 0
+                    continue
+                run = 0
+            position = self._encode(pixel, previous, position)
+            previous = pixel
+        self._position = position
+        self._previous = previous
+        self._run = run
+
+    def _encode(self, pixel: int, previous: int, position: int) -> int:
+        # Code a pixel that differs from the previous one, returning the new
+        # position in the buffer
+        buffer = self._buffer
+        red = pixel >> 11
+        green = (pixel >> 5) & 0x3F
+        blue = pixel & 0x1F
+        hash_ = (red * 3 + green * 5 + blue * 7) & 0x3F
+        if self._index[hash_] == pixel:
+            buffer[position] = _OP_INDEX | hash_
+            return position + 1
+        self._index[hash_] = pixel
+        dr = ((red - (previous >> 11) + 16) & 0x1F) - 16
+        dg = ((green - ((previous >> 5) & 0x3F) + 32) & 0x3F) - 32
+        db = ((blue - (previous & 0x1F) + 16) & 0x1F) - 16
+        if -2 <= dr <= 1 and -2 <= dg <= 1 and -2 <= db <= 1:
+            buffer[position] = _OP_DIFF | (dr + 2) << 4 | (dg + 2) << 2 | (db + 2)
+            return position + 1
+        dr -= dg >> 1
+        db -= dg >> 1
+        if -8 <= dr <= 7 and -8 <= db <= 7:
+            buffer[position] = _OP_LUMA | (dg + 32)
+            buffer[position + 1] = (dr + 8) << 4 | (db + 8)
+            return position + 2
+        buffer[position] = _OP_PIXEL
+        buffer[position + 1] = pixel >> 8
+        buffer[position + 2] = pixel & 0xFF
+        return position + 3
+
+    def write(self, data: ReadableBuffer) -> int:
+        """Compress a whole image, such as the buffer passed to
+        `adafruit_ov2640.OV2640.capture`, and `close` the stream
+
+        Args:
+            data (ReadableBuffer): The image
+        """
+        self.write_rows(data, 0)
+        return self.close()
+
+    def close(self) -> int:
+        """Finish the stream, and return its total length in bytes"""
+        if self._next_row != self._height:
+            raise ValueError(f"Only {self._next_row} of {self._height} rows written")
+        if self._position > len(self._buffer) - 9:
+            self._flush()
+        if self._run:
+            self._buffer[self._position] = _OP_RUN | (self._run - 1)
+            self._position += 1
+            self._run = 0
+        self._view[self._position : self._position + 8] = _END
+        self._position += 8
+        self._flush()
+        return self._length
+
+
+def _decode_pixel(
+    data: ReadableBuffer, position: int, previous: int, index: list
+) -> Tuple[int, int, int]:
+    # Decode the op at position, returning the pixel, how many times it
+    # repeats, and the position of the next op
+    op = data[position]
+    position += 1
+    if op == _OP_PIXEL:
+        return (data[position] << 8) | data[position + 1], 1, position + 2
+    if op >= _OP_RUN:
+        return previous, (op & 0x3F) + 1, position
+    if op < _OP_DIFF:
+        return index[op], 1, position
+    red = previous >> 11
+    green = (previous >> 5) & 0x3F
+    blue = previous & 0x1F
+    if op < _OP_LUMA:
+        red += ((op >> 4) & 3) - 2
+        green += ((op >> 2) & 3) - 2
+        blue += (op & 3) - 2
+    else:
+        dg = (op & 0x3F) - 32
+        second = data[position]
+        position += 1
+        green += dg
+        red += (dg >> 1) + (second >> 4) - 8
+        blue += (dg >> 1) + (second & 0xF) - 8
+    return (red & 0x1F) << 11 | (green & 0x3F) << 5 | (blue & 0x1F), 1, position
+
+
+def decode(data: ReadableBuffer, byte_order: int = 1) -> Tuple[int, int, bytearray]:
+    """Decompress an image compressed by `QOIEncoder`, and return its width,
+    height and pixels.
+
+    This is intended for a host computer, where the result can be viewed with
+    NumPy as ``numpy.frombuffer(pixels, "<u2").reshape((height, width))``.
+
+    Args:
+        data (ReadableBuffer): The compressed image
+        byte_order (int): The byte order of the pixels returned, one of the \
+            ``adafruit_ov2640.OV2640_BYTE_ORDER_`` constants
+    """
+    magic, width, height, bits, _ = struct.unpack_from(_HEADER, data, 0)
+    if magic != _MAGIC or bits != 16:
+        raise ValueError("Not a q565 image")
+    pixels = bytearray(2 * width * height)
+    index = [0] * 64
+    pixel = 0
+    position = _HEADER_SIZE
+    i = 0
+    while i < len(pixels):
+        pixel, run, position = _decode_pixel(data, position, pixel, index)
+        index[((pixel >> 11) * 3 + ((pixel >> 5) & 0x3F) * 5 + (pixel & 0x1F) * 7) & 0x3F] = pixel
+        for _ in range(run):
+            pixels[i + byte_order] = pixel >> 8
+            pixels[i + 1 - byte_order] = pixel & 0xFF
+            i += 2
+    if bytes(data[position : position + 8]) != _END:
+        raise ValueError("Bad end marker")
+    return width, height, pixels
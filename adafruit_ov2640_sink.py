@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_sink`
+================================================================================
+
+Writing captured images to files, sockets and other destinations in fixed-size
+chunks, optionally base64 encoded on the way, without copying the image.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import binascii
+from errno import EAGAIN
+
+try:
+    from typing import Any, Callable, Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+
+def item_size(data: ReadableBuffer) -> int:
+    """The size in bytes of each item of ``data``, which is 2 for the 16-bit
+    buffer of a ``displayio.Bitmap``, whose memoryview indexes whole pixels
+
+    Args:
+        data (ReadableBuffer): The buffer
+    """
+    view = memoryview(data)
+    # memoryview.itemsize is not available everywhere
+    return len(bytes(view[:1])) if view else 1
+
+
+def base64_length(length: int) -> int:
+    """The length of ``length`` bytes once base64 encoded, without a newline
+
+    Args:
+        length (int): The length of the data before encoding
+    """
+    return (length + 2) // 3 * 4
+
+
+def b64encode_in_place(buf: WriteableBuffer, length: int, chunk_size: int = 768) -> int:
+    """Base64 encode the first ``length`` bytes of ``buf`` in place, and return
+    the encoded length.
+
+    The data is encoded a chunk at a time from the end backwards, so each chunk
+    is written over data that has already been encoded, and only one chunk is
+    ever held in a second buffer.  ``buf`` must hold `base64_length` bytes,
+    4/3 of ``length``.  A JPEG capture buffer of ``capture_buffer_size`` bytes
+    only has room when the JPEG fills at most 3/4 of it, so check the length
+    first and fall back to another buffer, or skip the image, when it does not.
+
+    This suits APIs such as MQTT publishing, which need the whole message in one
+    buffer: the capture buffer is reused instead of allocating a second one.
+
+    Args:
+        buf (WriteableBuffer): The data to encode, and the encoded result
+        length (int): The length of the data
+        chunk_size (int): The number of bytes to encode at a time, rounded \
+            down to a multiple of 3
+    """
+    encoded_length = base64_length(length)
+    if encoded_length > len(buf):
+        raise ValueError(f"Buffer must hold {encoded_length} bytes")
+    view = memoryview(buf)
+    chunk_size -= chunk_size % 3
+    # The last chunk holds any partial group, so every other chunk starts and
+    # ends on a 3 byte boundary
+    start = (length - 1) // chunk_size * chunk_size if length else 0
+    end = length
+    while start >= 0 and end > 0:
+        encoded = binascii.b2a_base64(view[start:end])
+        output = start // 3 * 4
+        # Drop the trailing newline
+        view[output : output + len(encoded) - 1] = memoryview(encoded)[:-1]
+        end = start
+        start -= chunk_size
+    return encoded_length
+
+
+def _sender(send: Callable[[memoryview], int]) -> Callable[[memoryview], None]:
+    # Wrap a socket's send() to retry until the whole chunk is sent
+    def output(chunk: memoryview) -> None:
+        size = item_size(chunk)
+        while chunk:
+            try:
+                sent = send(chunk)
+            except OSError as error:
+                if error.errno == EAGAIN:
+                    continue
+                raise
+            if sent % size:
+                # Part of a 16-bit item went, so send the rest from a copy
+                chunk = memoryview(bytes(chunk)[sent:])
+                size = 1
+            else:
+                chunk = chunk[sent // size :]
+
+    return output
+
+
+class ChunkedSink:
+    """Write a captured image to a file, socket or callback in fixed-size chunks.
+
+    Files are written in chunks of ``chunk_size`` bytes aligned to the start of
+    the file, which for a multiple of the 512 byte sector size lets the
+    filesystem write whole sectors.  Sockets are sent to until every byte is
+    accepted, retrying partial sends and, for non-blocking sockets, ``EAGAIN``.
+    Any other callable is called with each chunk, as a `memoryview` that is only
+    valid until it returns.
+
+    With ``base64``, each chunk is encoded on its way out, so that an image can
+    be sent to a service that expects base64 without holding an encoded copy of
+    it.  Only one chunk of encoded data exists at a time.
+
+    Args:
+        chunk_size (int): The size of each chunk written, in bytes.  With \
+            ``base64`` this is the size after encoding, and is rounded down to \
+            a multiple of 4.
+        base64 (bool): Base64 encode the data, without newlines.
+    """
+
+    def __init__(self, chunk_size: int = 4096, base64: bool = False) -> None:
+        if base64:
+            chunk_size -= chunk_size % 4
+        if chunk_size <= 0:
+            raise ValueError("chunk_size too small")
+        self.chunk_size = chunk_size
+        self.base64 = base64
+
+    def write(self, target: Any, data: ReadableBuffer, length: Optional[int] = None) -> int:
+        """Write ``data`` to ``target`` and return the number of bytes written,
+        which with ``base64`` is the encoded length.
+
+        Args:
+            target: A file or other object with a ``write`` method, a socket or \
+                other object with a ``send`` method, or a callable.
+            data (ReadableBuffer): The data, such as the `memoryview` returned by \
+                `adafruit_ov2640.OV2640.capture`.
+            length (Optional[int]): The number of bytes of ``data`` to write, or \
+                None for all of it.
+        """
+        # Lengths and offsets are in bytes, and converted to items to slice
+        size = item_size(data)
+        if length is None:
+            length = len(data) * size
+        view = memoryview(data)[: length // size]
+        send = getattr(target, "send", None)
+        if send is not None:
+            output = _sender(send)
+        else:
+            output = getattr(target, "write", target)
+
+        chunk_size = self.chunk_size
+        if self.base64:
+            chunk_size = chunk_size // 4 * 3
+            chunk_size -= chunk_size % (3 * size)
+            for start in range(0, length, chunk_size):
+                encoded = binascii.b2a_base64(view[start // size : (start + chunk_size) // size])
+                output(memoryview(encoded)[:-1])
+            return base64_length(length)
+
+        chunk_size -= chunk_size % size
+        start = 0
+        tell = getattr(target, "tell", None)
+        if tell is not None:
+            # Write up to the next chunk boundary in the file first
+            start = min(-tell() % chunk_size, length)
+            start -= start % size
+            if start:
+                output(view[: start // size])
+        for offset in range(start, length, chunk_size):
+            output(view[offset // size : (offset + chunk_size) // size])
+        return length
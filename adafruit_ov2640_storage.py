@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_ov2640_storage`
+================================================================================
+
+Saving a numbered sequence of captured images to an SD card or other filesystem.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware, or CPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_OV2640.git"
+
+import os
+
+from adafruit_ov2640_sink import ChunkedSink
+
+try:
+    from typing import Optional
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+
+class ImageStore:
+    """Save images as ``img0000.jpg``, ``img0001.jpg`` and so on, in a directory.
+
+    The next number is kept in a small counter file in the directory, so saving
+    an image does not get slower as images accumulate.  The directory is only
+    listed once, when the store is created, and only if the counter file is
+    missing or out of date.  Each image file is extended to its final length
+    before it is written, so the filesystem allocates its clusters at once, and
+    the data is written in cluster-aligned, cluster-sized blocks straight from
+    the capture buffer.
+
+    Args:
+        directory (str): The directory to save images in, such as the mount \
+            point of an SD card.
+        prefix (str): The start of each file name.
+        extension (str): The default file name extension, without the dot.
+        digits (int): The minimum number of digits in the file names.
+        cluster_size (Optional[int]): The size of the blocks written, or None to \
+            use the block size the filesystem reports.
+    """
+
+    def __init__(
+        self,
+        directory: str = "/sd",
+        prefix: str = "img",
+        extension: str = "jpg",
+        digits: int = 4,
+        cluster_size: Optional[int] = None,
+    ) -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self.extension = extension
+        self.digits = digits
+        if cluster_size is None:
+            try:
+                cluster_size = os.statvfs(directory)[0]
+            except (AttributeError, OSError):
+                cluster_size = 4096
+        self._sink = ChunkedSink(cluster_size)
+        self._counter_file = f"{directory}/{prefix}.idx"
+        self._index = self._load_index()
+
+    @property
+    def cluster_size(self) -> int:
+        """The size of the blocks that images are written in"""
+        return self._sink.chunk_size
+
+    @property
+    def next_index(self) -> int:
+        """The number of the next image to be saved"""
+        return self._index
+
+    def filename(self, index: int, extension: Optional[str] = None) -> str:
+        """The full path of the image with the given number
+
+        Args:
+            index (int): The image number
+            extension (Optional[str]): The file name extension, or None for the \
+                default
+        """
+        return (
+            f"{self.directory}/{self.prefix}{index:0{self.digits}d}.{extension or self.extension}"
+        )
+
+    def _load_index(self) -> int:
+        try:
+            with open(self._counter_file) as f:
+                index = int(f.read())
+            try:
+                # Another program, or a power cut before the counter was saved,
+                # could have left it behind the files
+                os.stat(self.filename(index))
+            except OSError:
+                return index
+        except (OSError, ValueError):
+            pass
+        return self._scan()
+
+    def _scan(self) -> int:
+        prefix = self.prefix
+        index = 0
+        for name in os.listdir(self.directory):
+            if not name.startswith(prefix):
+                continue
+            number = name[len(prefix) :].split(".", 1)[0]
+            if number.isdigit():
+                index = max(index, int(number) + 1)
+        return index
+
+    def reserve(self, extension: Optional[str] = None) -> str:
+        """Claim the next image number, and return its full path, for writing
+        an image without `save`
+
+        Args:
+            extension (Optional[str]): The file name extension, or None for the \
+                default
+        """
+        filename = self.filename(self._index, extension)
+        self._index += 1
+        with open(self._counter_file, "w") as f:
+            f.write(str(self._index))
+        return filename
+
+    def save(
+        self,
+        data: ReadableBuffer,
+        length: Optional[int] = None,
+        extension: Optional[str] = None,
+    ) -> str:
+        """Save an image under the next number, and return its full path
+
+        Args:
+            data (ReadableBuffer): The image, such as the `memoryview` returned by \
+                `adafruit_ov2640.OV2640.capture`
+            length (Optional[int]): The number of bytes of ``data`` to save, or \
+                None for all of it
+            extension (Optional[str]): The file name extension, or None for the \
+                default
+        """
+        if length is None:
+            length = len(data)
+        filename = self.reserve(extension)
+        with open(filename, "wb") as f:
+            if length:
+                # Allocate the whole file before writing it
+                f.seek(length - 1)
+                f.write(b"\0")
+                f.seek(0)
+            self._sink.write(f, data, length)
+        return filename
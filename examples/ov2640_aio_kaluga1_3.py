@@ -18,9 +18,11 @@ The maximum image size is 100kB after base64 encoding, or about 65kB before
 base64 encoding.  In practice, "SVGA" (800x600) images are typically around
 40kB even though the "capture_buffer_size" (theoretical maximum size) is
 (width*height/5) bytes or 96kB.
+
+Frames that look the same as the one before, judging by the sizes of their
+compressed data, are not uploaded.
 """
 
-import binascii
 import time
 from os import getenv
 
@@ -32,6 +34,8 @@ import wifi
 from adafruit_io.adafruit_io import IO_MQTT
 
 import adafruit_ov2640
+from adafruit_ov2640_jpeg import JPEGChangeDetector, JPEGHeader
+from adafruit_ov2640_sink import b64encode_in_place, base64_length
 
 feed_name = "image"
 
@@ -77,15 +81,37 @@ cam.test_pattern = False
 cam.size = adafruit_ov2640.OV2640_SIZE_SVGA
 cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
 jpeg_buffer = bytearray(cam.capture_buffer_size)
+header = JPEGHeader()
+detector = JPEGChangeDetector()
+first = True
 while True:
     jpeg = cam.capture(jpeg_buffer)
     print(f"Captured {len(jpeg)} bytes of jpeg data")
-
-    # b2a_base64() appends a trailing newline, which IO does not like
-    encoded_data = binascii.b2a_base64(jpeg).strip()
+    if not header.parse(jpeg):
+        print(f"Corrupt frame ({header.error}), not uploading")
+        continue
+
+    # Compare with the previous frame.  The bytearray is searched much faster
+    # than the memoryview of it.
+    if not detector.update(jpeg_buffer, len(jpeg)) and not first:
+        print(f"Unchanged (score {detector.score:.3f}), not uploading")
+        time.sleep(3)
+        continue
+    first = False
+
+    # Encode in the capture buffer itself rather than into a second buffer.
+    # There is only room when the JPEG fills at most 3/4 of the buffer, so
+    # larger images are skipped.  MQTT needs the message as bytes, which is the
+    # only copy made.
+    if base64_length(len(jpeg)) > len(jpeg_buffer):
+        print("Too large to upload")
+        continue
+    encoded_length = b64encode_in_place(jpeg_buffer, len(jpeg))
+    encoded_data = bytes(memoryview(jpeg_buffer)[:encoded_length])
     print(f"Expanded to {len(encoded_data)} for IO upload")
 
     io.publish("image", encoded_data)
+    del encoded_data
 
     print("Waiting 3s")
     time.sleep(3)
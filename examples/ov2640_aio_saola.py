@@ -16,7 +16,6 @@ base64 encoding.  In practice, "SVGA" (800x600) images are typically around
 (width*height/5) bytes or 96kB.
 """
 
-import binascii
 import time
 from os import getenv
 
@@ -28,6 +27,7 @@ import wifi
 from adafruit_io.adafruit_io import IO_MQTT
 
 import adafruit_ov2640
+from adafruit_ov2640_sink import b64encode_in_place, base64_length
 
 feed_name = "image-saola-ov2640"
 
@@ -85,9 +85,17 @@ while True:
     jpeg = cam.capture(jpeg_buffer)
     print(f"Captured {len(jpeg)} bytes of jpeg data")
 
-    # b2a_base64() appends a trailing newline, which IO does not like
-    encoded_data = binascii.b2a_base64(jpeg).strip()
+    # Encode in the capture buffer itself rather than into a second buffer.
+    # There is only room when the JPEG fills at most 3/4 of the buffer, so
+    # larger images are skipped.  MQTT needs the message as bytes, which is the
+    # only copy made.
+    if base64_length(len(jpeg)) > len(jpeg_buffer):
+        print("Too large to upload")
+        continue
+    encoded_length = b64encode_in_place(jpeg_buffer, len(jpeg))
+    encoded_data = bytes(memoryview(jpeg_buffer)[:encoded_length])
     print(f"Expanded to {len(encoded_data)} for IO upload")
     io.publish(feed_name, encoded_data)
+    del encoded_data
     print("Waiting 10s")
     time.sleep(10)
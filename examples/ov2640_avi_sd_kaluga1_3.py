@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Record a short Motion JPEG video clip to SD.
+
+Each time this runs it records CLIP_SECONDS of QVGA JPEG frames to a new AVI
+file on the card, which plays in VLC, ffplay and most other video players.
+
+The Kaluga development kit comes in two versions (v1.2 and v1.3); this demo is
+tested on v1.3.
+
+The audio board must be mounted between the Kaluga and the LCD, it provides the
+I2C pull-ups(!)
+
+This example also requires an SD card breakout wired as follows:
+ * IO18: SD Clock Input
+ * IO17: SD Serial Output (MISO)
+ * IO14: SD Serial Input (MOSI)
+ * IO12: SD Chip Select
+
+Insert a CircuitPython-compatible SD card before powering on the Kaluga.
+"""
+
+import time
+
+import board
+import busio
+import sdcardio
+import storage
+
+import adafruit_ov2640
+from adafruit_ov2640_avi import AVIWriter
+from adafruit_ov2640_storage import ImageStore
+
+CLIP_SECONDS = 10
+
+bus = busio.I2C(scl=board.CAMERA_SIOC, sda=board.CAMERA_SIOD)
+cam = adafruit_ov2640.OV2640(
+    bus,
+    data_pins=board.CAMERA_DATA,
+    clock=board.CAMERA_PCLK,
+    vsync=board.CAMERA_VSYNC,
+    href=board.CAMERA_HREF,
+    mclk=board.CAMERA_XCLK,
+    mclk_frequency=20_000_000,
+    size=adafruit_ov2640.OV2640_SIZE_QVGA,
+)
+cam.flip_x = False
+cam.flip_y = True
+cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
+
+sd_spi = busio.SPI(clock=board.IO18, MOSI=board.IO14, MISO=board.IO17)
+sdcard = sdcardio.SDCard(sd_spi, board.IO12)
+vfs = storage.VfsFat(sdcard)
+storage.mount(vfs, "/sd")
+
+cam.allocate_buffer_pool([(cam.size, cam.colorspace)])
+print(f"Discarded {cam.settle()} frames")
+
+filename = ImageStore("/sd", prefix="clip", extension="avi").reserve()
+print("#", filename)
+# Play back at the rate the frames were captured
+video = AVIWriter(open(filename, "wb"), cam.width, cam.height)
+deadline = time.monotonic() + CLIP_SECONDS
+while time.monotonic() < deadline:
+    video.write_frame(cam.capture())
+video.close()
+print(f"Recorded {video.frames} frames in {CLIP_SECONDS} seconds")
@@ -25,9 +25,6 @@ Insert a CircuitPython-compatible SD card before powering on the Kaluga.
 Press the "Record" button on the audio daughterboard to take a photo in BMP format.
 """
 
-import os
-import struct
-
 import analogio
 import board
 import busdisplay
@@ -36,9 +33,10 @@ import displayio
 import fourwire
 import sdcardio
 import storage
-import ulab.numpy as np
 
 import adafruit_ov2640
+from adafruit_ov2640_imagefile import BMPWriter
+from adafruit_ov2640_storage import ImageStore
 
 # Nominal voltages of several of the buttons on the audio daughterboard
 V_MODE = 1.98
@@ -102,12 +100,14 @@ cam = adafruit_ov2640.OV2640(
 cam.flip_x = False
 cam.flip_y = False
 cam.test_pattern = False
+# Send the low byte of each pixel first, as BMP files store them
+cam.byte_order = adafruit_ov2640.OV2640_BYTE_ORDER_LITTLE_ENDIAN
 
 g = displayio.Group(scale=1)
 bitmap = displayio.Bitmap(320, 240, 65536)
 tg = displayio.TileGrid(
     bitmap,
-    pixel_shader=displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565_SWAPPED),
+    pixel_shader=displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565),
 )
 g.append(tg)
 display.root_group = g
@@ -119,87 +119,16 @@ sdcard = sdcardio.SDCard(sd_spi, sd_cs)
 vfs = storage.VfsFat(sdcard)
 storage.mount(vfs, "/sd")
 
-
-def exists(filename):
-    try:
-        os.stat(filename)
-        return True
-    except OSError:
-        return False
-
-
-_image_counter = 0
-
-
-def open_next_image(extension="jpg"):
-    global _image_counter  # noqa: PLW0603
-    while True:
-        filename = f"/sd/img{_image_counter:04d}.{extension}"
-        _image_counter += 1
-        if exists(filename):
-            continue
-        print("#", filename)
-        return open(filename, "wb")
-
-
-### These routines are for writing BMP files in the RGB565 or BGR565 formats.
-_BI_BITFIELDS = 3
-
-_bitmask_rgb565 = (0xF800, 0x7E0, 0x1F)
-_bitmask_bgr565 = (0x1F, 0x7E0, 0xF800)
-
-
-def write_header(output_file, width, height, masks):
-    def put_word(value):
-        output_file.write(struct.pack("<H", value))
-
-    def put_dword(value):
-        output_file.write(struct.pack("<I", value))
-
-    def put_long(value):
-        output_file.write(struct.pack("<i", value))
-
-    def put_padding(length):
-        output_file.write(b"\0" * length)
-
-    filesize = 14 + 108 + height * width * 2
-
-    # BMP header
-    output_file.write(b"BM")
-    put_dword(filesize)
-    put_word(0)  # Creator 1
-    put_word(0)  # Creator 2
-    put_dword(14 + 108)  # Offset of bitmap data
-
-    # DIB header (BITMAPV4HEADER)
-    put_dword(108)  # sizeof(BITMAPV4HEADER)
-    put_long(width)
-    put_long(-height)
-    put_word(1)  # number of color planes (must be 1)
-    put_word(16)  # number of bits per pixel
-    put_dword(_BI_BITFIELDS)  # "compression"
-    put_dword(2 * width * height)  # size of raw bitmap data
-    put_long(11811)  # 72dpi -> pixels/meter
-    put_long(11811)  # 72dpi -> pixels/meter
-    put_dword(0)  # palette size
-    put_dword(0)  # important color count
-    put_dword(masks[0])  # red mask
-    put_dword(masks[1])  # green mask
-    put_dword(masks[2])  # blue mask
-    put_dword(0)  # alpha mask
-    put_dword(0)  # CS Type
-    put_padding(3 * 3 * 4)  # CIEXYZ infrmation
-    put_dword(144179)  # 2.2 gamma red
-    put_dword(144179)  # 2.2 gamma green
-    put_dword(144179)  # 2.2 gamma blue
+# Number the images from a counter kept on the card, instead of checking
+# every file name in turn
+store = ImageStore("/sd", extension="bmp")
 
 
 def capture_image_bmp(the_bitmap):
-    with open_next_image("bmp") as f:
-        swapped = np.frombuffer(the_bitmap, dtype=np.uint16)
-        swapped.byteswap(inplace=True)
-        write_header(f, the_bitmap.width, the_bitmap.height, _bitmask_rgb565)
-        f.write(swapped)
+    filename = store.reserve()
+    print("#", filename)
+    with open(filename, "wb") as f:
+        BMPWriter(f, the_bitmap.width, the_bitmap.height).write(the_bitmap)
 
 
 display.auto_refresh = False
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""Measure the speed of each pixel format conversion in adafruit_ov2640_convert.
+
+No camera is needed; the conversions run on a synthetic 160x120 frame.  This
+runs on any CircuitPython board, using ulab if the firmware includes it, or
+on a host computer with CPython, using NumPy if it is installed.  Without
+either, the much slower pure Python conversions are measured.
+"""
+
+import time
+
+import adafruit_ov2640_convert as convert
+
+WIDTH = 160
+HEIGHT = 120
+REPEAT = 5
+
+print("Using", "pure Python" if convert.np is None else convert.np.__name__)
+
+# A frame of 16-bit pixels, YUV422 or RGB565 depending on the conversion
+src = bytearray((i * 7) & 0xFF for i in range(WIDTH * HEIGHT * 2))
+dest = bytearray(WIDTH * HEIGHT * 3)
+gray = memoryview(dest)[: WIDTH * HEIGHT]
+same_size = memoryview(dest)[: len(src)]
+
+benchmarks = (
+    ("yuv_to_rgb565", lambda: convert.yuv_to_rgb565(src, same_size)),
+    ("yuv_to_rgb565 in place", lambda: convert.yuv_to_rgb565(src)),
+    ("yuv_to_rgb565 swapped", lambda: convert.yuv_to_rgb565(src, same_size, dest_byte_order=0)),
+    ("yuv_to_gray", lambda: convert.yuv_to_gray(src, gray)),
+    ("rgb565_to_bgr565", lambda: convert.rgb565_to_bgr565(src, same_size)),
+    ("rgb565_to_bgr565 in place", lambda: convert.rgb565_to_bgr565(src)),
+    ("rgb565_to_rgb888", lambda: convert.rgb565_to_rgb888(src, dest)),
+    ("byteswap16", lambda: convert.byteswap16(src, same_size)),
+    ("byteswap16 in place", lambda: convert.byteswap16(src)),
+)
+if convert.np is not None:
+    # These need ulab or NumPy
+    benchmarks += (
+        ("yuv_to_luma", lambda: convert.yuv_to_luma(src, WIDTH, HEIGHT, gray)),
+        ("yuv_to_luma scale=2", lambda: convert.yuv_to_luma(src, WIDTH, HEIGHT, gray, scale=2)),
+    )
+
+for name, function in benchmarks:
+    start = time.monotonic_ns()
+    for _ in range(REPEAT):
+        function()
+    elapsed = time.monotonic_ns() - start
+    rate = len(src) * REPEAT * 1_000_000_000 // max(elapsed, 1)
+    print(f"{name:28} {rate:>12} bytes/second")
@@ -25,7 +25,6 @@ Insert a CircuitPython-compatible SD card before powering on the Kaluga.
 Press the "Record" button on the audio daughterboard to take a photo.
 """
 
-import os
 import struct
 
 import analogio
@@ -38,6 +37,7 @@ import sdcardio
 import storage
 
 import adafruit_ov2640
+from adafruit_ov2640_storage import ImageStore
 
 V_MODE = 1.98
 V_RECORD = 2.41
@@ -97,6 +97,8 @@ cam = adafruit_ov2640.OV2640(
 
 cam.flip_x = False
 cam.flip_y = True
+# Carry the preview exposure over to the still capture mode
+cam.exposure_transfer = True
 pid = cam.product_id
 ver = cam.product_version
 print(f"Detected pid={pid:x} ver={ver:x}")
@@ -112,47 +114,25 @@ sdcard = sdcardio.SDCard(sd_spi, sd_cs)
 vfs = storage.VfsFat(sdcard)
 storage.mount(vfs, "/sd")
 
-
-def exists(filename):
-    try:
-        os.stat(filename)
-        return True
-    except OSError:
-        return False
-
-
-_image_counter = 0
-
-
-def open_next_image():
-    global _image_counter  # noqa: PLW0603
-    while True:
-        filename = f"/sd/img{_image_counter:04d}.jpg"
-        _image_counter += 1
-        if exists(filename):
-            continue
-        print("#", filename)
-        return open(filename, "wb")
+# Number the images from a counter kept on the card, instead of checking
+# every file name in turn
+store = ImageStore("/sd")
 
 
 def capture_image():
     old_size = cam.size
     old_colorspace = cam.colorspace
-    exposure = cam.exposure
     try:
         cam.size = adafruit_ov2640.OV2640_SIZE_UXGA
         cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
-        cam.exposure = exposure
         b = bytearray(cam.capture_buffer_size)
         jpeg = cam.capture(b)
 
         print(f"Captured {len(jpeg)} bytes of jpeg data")
-        with open_next_image() as f:
-            f.write(jpeg)
+        print("#", store.save(jpeg))
     finally:
         cam.size = old_size
         cam.colorspace = old_colorspace
-        cam.exposure = exposure
 
 
 def main():
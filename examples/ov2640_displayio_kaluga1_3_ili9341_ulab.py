@@ -71,7 +71,10 @@ display.root_group = g
 display.auto_refresh = False
 while True:
     cam.capture(bitmap)
-    arr[:] = ~arr  # Invert every pixel in the bitmap, via the array
+    # Invert every pixel in the bitmap, via the array.  (For just a negative
+    # image, cam.special_effect = adafruit_ov2640.OV2640_EFFECT_NEGATIVE does
+    # this in the camera without using the CPU.)
+    arr[:] = ~arr
     bitmap.dirty()
     display.refresh(minimum_frames_per_second=0)
 
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Record a sequence of uncompressed RGB565 frames to a single file on SD.
+
+Each frame is stored with its timestamp, exposure and gain, for analysis on a
+computer, where the recording can be loaded with NumPy::
+
+    from adafruit_ov2640_frames import FrameReader
+
+    recording = FrameReader("frames0000.ovr")
+    frames = recording.to_numpy()
+    print(frames["timestamp"], frames["exposure"], frames["pixels"].shape)
+
+The Kaluga development kit comes in two versions (v1.2 and v1.3); this demo is
+tested on v1.3.
+
+The audio board must be mounted between the Kaluga and the LCD, it provides the
+I2C pull-ups(!)
+
+This example also requires an SD card breakout wired as follows:
+ * IO18: SD Clock Input
+ * IO17: SD Serial Output (MISO)
+ * IO14: SD Serial Input (MOSI)
+ * IO12: SD Chip Select
+
+Insert a CircuitPython-compatible SD card before powering on the Kaluga.
+"""
+
+import time
+
+import board
+import busio
+import sdcardio
+import storage
+
+import adafruit_ov2640
+from adafruit_ov2640_frames import FrameWriter
+from adafruit_ov2640_storage import ImageStore
+
+FRAMES = 100
+
+bus = busio.I2C(scl=board.CAMERA_SIOC, sda=board.CAMERA_SIOD)
+cam = adafruit_ov2640.OV2640(
+    bus,
+    data_pins=board.CAMERA_DATA,
+    clock=board.CAMERA_PCLK,
+    vsync=board.CAMERA_VSYNC,
+    href=board.CAMERA_HREF,
+    mclk=board.CAMERA_XCLK,
+    mclk_frequency=20_000_000,
+    size=adafruit_ov2640.OV2640_SIZE_QQVGA,
+)
+cam.flip_x = False
+cam.flip_y = True
+
+sd_spi = busio.SPI(clock=board.IO18, MOSI=board.IO14, MISO=board.IO17)
+sdcard = sdcardio.SDCard(sd_spi, board.IO12)
+vfs = storage.VfsFat(sdcard)
+storage.mount(vfs, "/sd")
+
+buf = bytearray(cam.capture_buffer_size)
+print(f"Discarded {cam.settle(buf)} frames")
+
+filename = ImageStore("/sd", prefix="frames", extension="ovr").reserve()
+print("#", filename)
+recording = FrameWriter(
+    open(filename, "wb"),
+    cam.width,
+    cam.height,
+    cam.colorspace,
+    cam.byte_order,
+    max_frames=FRAMES,
+)
+start = time.monotonic()
+for _ in range(FRAMES):
+    cam.capture(buf)
+    recording.write_frame(buf, cam.exposure, cam.gain)
+recording.close()
+print(f"Recorded {FRAMES} frames in {time.monotonic() - start:.1f} seconds")
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Stream video from the camera to web browsers, on the Espressif Saola Wrover.
+
+This example requires that your WIFI credentials be configured in
+CIRCUITPY/settings.toml.  Once connected it prints its address; open it in a
+browser to watch the stream, or fetch /snapshot.jpg for a single image.  Every
+viewer is served from the same captured frames.
+"""
+
+from os import getenv
+
+import board
+import busio
+import socketpool
+import wifi
+
+import adafruit_ov2640
+from adafruit_ov2640_http import MJPEGServer
+
+print("Connecting to WIFI")
+wifi.radio.connect(getenv("CIRCUITPY_WIFI_SSID"), getenv("CIRCUITPY_WIFI_PASSWORD"))
+pool = socketpool.SocketPool(wifi.radio)
+
+bus = busio.I2C(scl=board.IO7, sda=board.IO8)
+cam = adafruit_ov2640.OV2640(
+    bus,
+    data_pins=(
+        board.IO36,
+        board.IO37,
+        board.IO41,
+        board.IO42,
+        board.IO39,
+        board.IO40,
+        board.IO21,
+        board.IO38,
+    ),
+    clock=board.IO33,
+    vsync=board.IO2,
+    href=board.IO3,
+    mclk=board.IO1,
+    mclk_frequency=20_000_000,
+    size=adafruit_ov2640.OV2640_SIZE_QVGA,
+)
+cam.flip_x = False
+cam.flip_y = False
+cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
+
+server = MJPEGServer(cam, pool, port=80, max_clients=3)
+print(f"Streaming at http://{wifi.radio.ipv4_address}/")
+server.serve_forever()
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Run the MJPEG streaming server on a computer, with a simulated camera.
+
+This needs CPython and Pillow, and serves a moving test image at
+http://localhost:8080/ until interrupted with Ctrl-C.
+"""
+
+import io
+import socket
+
+from PIL import Image, ImageDraw
+
+from adafruit_ov2640_http import MJPEGServer, SimulatedCamera
+
+WIDTH = 320
+HEIGHT = 240
+FRAMES = 60
+
+
+def make_frame(number):
+    image = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 64))
+    draw = ImageDraw.Draw(image)
+    x = number * WIDTH // FRAMES
+    draw.rectangle((x, 0, x + WIDTH // 8, HEIGHT), fill=(255, 255, 0))
+    draw.text((8, 8), f"frame {number}", fill=(255, 255, 255))
+    jpeg = io.BytesIO()
+    image.save(jpeg, "JPEG")
+    return jpeg.getvalue()
+
+
+cam = SimulatedCamera([make_frame(i) for i in range(FRAMES)], fps=15)
+server = MJPEGServer(cam, socket, host="127.0.0.1", port=8080)
+print("Streaming at http://localhost:8080/")
+server.serve_forever()
@@ -27,8 +27,6 @@ Insert a CircuitPython-compatible SD card before powering on the Kaluga.
 Press the "Record" button on the audio daughterboard to take a photo.
 """
 
-import os
-
 import analogio
 import board
 import busio
@@ -39,6 +37,7 @@ import storage
 from adafruit_ili9341 import ILI9341
 
 import adafruit_ov2640
+from adafruit_ov2640_storage import ImageStore
 
 V_MODE = 1.98
 V_RECORD = 2.41
@@ -90,27 +89,13 @@ sdcard = sdcardio.SDCard(sd_spi, sd_cs)
 vfs = storage.VfsFat(sdcard)
 storage.mount(vfs, "/sd")
 
+# Allocate the still-capture buffer once, so that repeated captures do not
+# fragment the heap while the preview bitmap is alive
+cam.allocate_buffer_pool([(adafruit_ov2640.OV2640_SIZE_UXGA, adafruit_ov2640.OV2640_COLOR_JPEG)])
 
-def exists(filename):
-    try:
-        os.stat(filename)
-        return True
-    except OSError:
-        return False
-
-
-_image_counter = 0
-
-
-def open_next_image():
-    global _image_counter  # noqa: PLW0603
-    while True:
-        filename = f"/sd/img{_image_counter:04d}.jpg"
-        _image_counter += 1
-        if exists(filename):
-            continue
-        print("#", filename)
-        return open(filename, "wb")
+# Number the images from a counter kept on the card, instead of checking
+# every file name in turn
+store = ImageStore("/sd")
 
 
 def capture_image():
@@ -120,12 +105,12 @@ def capture_image():
     try:
         cam.size = adafruit_ov2640.OV2640_SIZE_UXGA
         cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
-        b = bytearray(cam.capture_buffer_size)
-        jpeg = cam.capture(b)
+        # Let the exposure settle after the mode change
+        print(f"Discarded {cam.settle()} frames")
+        jpeg = cam.capture()
 
         print(f"Captured {len(jpeg)} bytes of jpeg data")
-        with open_next_image() as f:
-            f.write(jpeg)
+        print("#", store.save(jpeg))
     finally:
         cam.size = old_size
         cam.colorspace = old_colorspace
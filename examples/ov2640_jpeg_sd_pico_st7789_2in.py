@@ -22,7 +22,6 @@ Insert a CircuitPython-compatible SD card before powering on the Kaluga.
 Press the "Record" button on the audio daughterboard to take a photo.
 """
 
-import os
 import time
 
 import board
@@ -42,6 +41,7 @@ from displayio import (
 )
 
 import adafruit_ov2640
+from adafruit_ov2640_storage import ImageStore
 
 release_displays()
 # Set up the display (You must customize this block for your display!)
@@ -106,27 +106,13 @@ display.root_group = g
 
 display.auto_refresh = False
 
+# Allocate the still-capture buffer once, so that repeated captures do not
+# fragment the heap while the preview bitmap is alive
+cam.allocate_buffer_pool([(adafruit_ov2640.OV2640_SIZE_QVGA, adafruit_ov2640.OV2640_COLOR_JPEG)])
 
-def exists(filename):
-    try:
-        os.stat(filename)
-        return True
-    except OSError:
-        return False
-
-
-_image_counter = 0
-
-
-def open_next_image():
-    global _image_counter  # noqa: PLW0603
-    while True:
-        filename = f"/sd/img{_image_counter:04d}.jpg"
-        _image_counter += 1
-        if exists(filename):
-            continue
-        print("#", filename)
-        return open(filename, "wb")
+# Number the images from a counter kept on the card, instead of checking
+# every file name in turn
+store = ImageStore("/sd")
 
 
 def capture_image():
@@ -136,12 +122,12 @@ def capture_image():
     try:
         cam.size = adafruit_ov2640.OV2640_SIZE_QVGA
         cam.colorspace = adafruit_ov2640.OV2640_COLOR_JPEG
-        b = bytearray(cam.capture_buffer_size)
-        jpeg = cam.capture(b)
+        # Let the exposure settle after the mode change
+        print(f"Discarded {cam.settle()} frames")
+        jpeg = cam.capture()
 
         print(f"Captured {len(jpeg)} bytes of jpeg data")
-        with open_next_image() as f:
-            f.write(jpeg)
+        print("#", store.save(jpeg))
     finally:
         cam.size = old_size
         cam.colorspace = old_colorspace
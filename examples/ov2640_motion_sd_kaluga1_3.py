@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Save a JPEG image to SD only when something in the scene changes.
+
+The camera watches the scene in small 96x96 YUV frames, which is fast and uses
+little memory, and only switches to SVGA JPEG when the motion detector reports
+a change.  On a quiet scene nothing is written at all.
+
+The Kaluga development kit comes in two versions (v1.2 and v1.3); this demo is
+tested on v1.3.  It requires ulab.
+
+The audio board must be mounted between the Kaluga and the LCD, it provides the
+I2C pull-ups(!)
+
+This example also requires an SD card breakout wired as follows:
+ * IO18: SD Clock Input
+ * IO17: SD Serial Output (MISO)
+ * IO14: SD Serial Input (MOSI)
+ * IO12: SD Chip Select
+
+Insert a CircuitPython-compatible SD card before powering on the Kaluga.
+"""
+
+import board
+import busio
+import sdcardio
+import storage
+
+import adafruit_ov2640
+from adafruit_ov2640_motion import MotionDetector
+from adafruit_ov2640_storage import ImageStore
+
+bus = busio.I2C(scl=board.CAMERA_SIOC, sda=board.CAMERA_SIOD)
+cam = adafruit_ov2640.OV2640(
+    bus,
+    data_pins=board.CAMERA_DATA,
+    clock=board.CAMERA_PCLK,
+    vsync=board.CAMERA_VSYNC,
+    href=board.CAMERA_HREF,
+    mclk=board.CAMERA_XCLK,
+    mclk_frequency=20_000_000,
+)
+cam.flip_x = False
+cam.flip_y = True
+
+sd_spi = busio.SPI(clock=board.IO18, MOSI=board.IO14, MISO=board.IO17)
+sdcard = sdcardio.SDCard(sd_spi, board.IO12)
+vfs = storage.VfsFat(sdcard)
+storage.mount(vfs, "/sd")
+
+cam.allocate_buffer_pool([(adafruit_ov2640.OV2640_SIZE_SVGA, adafruit_ov2640.OV2640_COLOR_JPEG)])
+detector = MotionDetector(cam)
+store = ImageStore("/sd", prefix="motion")
+
+while True:
+    jpeg = detector.capture_on_motion(adafruit_ov2640.OV2640_SIZE_SVGA)
+    if jpeg is None:
+        continue
+    filename = store.save(jpeg)
+    print(f"{detector.score:.0%} of blocks changed, saved {len(jpeg)} bytes as {filename}")
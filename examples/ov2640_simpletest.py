@@ -9,8 +9,8 @@ This demo is designed to run on the Kaluga, but you can adapt it
 to other boards by changing the constructors for `bus` and `cam`
 appropriately.
 
-The camera is placed in YUV mode, so the top 8 bits of each color
-value can be treated as "greyscale".
+The camera is placed in YUV mode, so the luma (Y) value of each pixel
+can be used as "greyscale".
 
 It's important that you use a terminal program that can interpret
 "ANSI" escape sequences.  The demo uses them to "paint" each frame
@@ -27,6 +27,7 @@ import board
 import busio
 
 import adafruit_ov2640
+from adafruit_ov2640_convert import yuv_to_luma
 
 bus = busio.I2C(scl=board.CAMERA_SIOC, sda=board.CAMERA_SIOD)
 cam = adafruit_ov2640.OV2640(
@@ -48,15 +49,19 @@ chars = b" .:-=+*#%@"
 remap = [chars[i * (len(chars) - 1) // 255] for i in range(256)]
 
 width = cam.width
+height = cam.height
+# The luma (greyscale) image at half size, one byte per pixel
+luma = bytearray((width // 2) * (height // 2))
 row = bytearray(2 * width)
 
 sys.stdout.write("\033[2J")
 while True:
     cam.capture(buf)
-    for j in range(cam.height // 2):
+    yuv_to_luma(buf, width, height, luma, scale=2)
+    for j in range(height // 2):
         sys.stdout.write(f"\033[{j}H")
-        for i in range(cam.width // 2):
-            row[i * 2] = row[i * 2 + 1] = remap[buf[4 * (width * j + i)]]
+        for i in range(width // 2):
+            row[i * 2] = row[i * 2 + 1] = remap[luma[width // 2 * j + i]]
         sys.stdout.write(row)
         sys.stdout.write("\033[K")
     sys.stdout.write("\033[J")
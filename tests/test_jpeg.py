@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_ov2640_jpeg
+
+
+def _segment(marker: int, payload: bytes) -> bytes:
+    return bytes((0xFF, marker)) + (len(payload) + 2).to_bytes(2, "big") + payload
+
+
+def _jpeg(frame: bytes, scan: bytes) -> bytes:
+    # A grayscale baseline header, with one code of each length in the Huffman
+    # tables, and a token scan
+    quantization = _segment(0xDB, bytes([0]) + bytes([1] * 64))
+    huffman = _segment(0xC4, bytes([0x00, 1] + [0] * 15 + [0])) + _segment(
+        0xC4, bytes([0x10, 1] + [0] * 15 + [0])
+    )
+    return (
+        b"\xff\xd8"
+        + quantization
+        + _segment(0xC0, frame)
+        + huffman
+        + _segment(0xDA, scan)
+        + b"\x00\x00\xff\xd9"
+    )
+
+
+_FRAME = bytes([8, 0, 16, 0, 16, 1, 1, 0x11, 0])
+_SCAN = bytes([1, 1, 0x00, 0, 63, 0])
+
+
+def test_valid() -> None:
+    header = adafruit_ov2640_jpeg.JPEGHeader()
+    assert header.parse(_jpeg(_FRAME, _SCAN)), header.error
+    assert (header.width, header.height, header.components) == (16, 16, 1)
+
+
+def test_truncated_frame_header() -> None:
+    # Four components declared, but room for only one, at the end of the data
+    header = adafruit_ov2640_jpeg.JPEGHeader()
+    frame = bytearray(_FRAME)
+    frame[5] = 4
+    image = _jpeg(bytes(frame), _SCAN)
+    image = image[: image.index(b"\xff\xc4")] + b"\xff\xd9"
+    assert not header.parse(image)
+    assert header.error.startswith("Truncated frame header")
+
+
+def test_truncated_scan_header() -> None:
+    # More scan components declared than there is data
+    header = adafruit_ov2640_jpeg.JPEGHeader()
+    scan = bytearray(_SCAN)
+    scan[0] = 200
+    image = _jpeg(_FRAME, bytes(scan))
+    assert not header.parse(image[:-4] + b"\xff\xd9")
+    assert header.error.startswith("Truncated scan header")
+
+
+def test_thumbnail_buffer_too_small() -> None:
+    # A 16x16 image makes a 2x2 thumbnail, 8 bytes of RGB565
+    dest = bytearray(7)
+    with pytest.raises(ValueError, match="8 bytes"):
+        adafruit_ov2640_jpeg.decode_thumbnail(_jpeg(_FRAME, _SCAN), dest)
+    assert dest == bytearray(7)
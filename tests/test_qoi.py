@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import io
+from array import array
+
+import adafruit_ov2640_qoi
+
+WIDTH = 16
+HEIGHT = 8
+
+
+def _image() -> array:
+    # Flat areas, gradients and a few arbitrary colors, to use every opcode
+    pixels = array("H", [0] * (WIDTH * HEIGHT))
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            if y < 2:
+                pixel = 0x1234
+            elif y < 5:
+                pixel = (x << 11) | (2 * y << 5) | x
+            else:
+                pixel = (x * 0x9E37 + y * 0x79B9) & 0xFFFF
+            pixels[y * WIDTH + x] = pixel
+    return pixels
+
+
+def _encode(data, byte_order: int) -> bytes:
+    output = io.BytesIO()
+    encoder = adafruit_ov2640_qoi.QOIEncoder(output, WIDTH, HEIGHT, byte_order, chunk_size=16)
+    encoder.write(data)
+    return output.getvalue()
+
+
+def test_bytes_round_trip() -> None:
+    pixels = _image()
+    data = pixels.tobytes()
+    width, height, decoded = adafruit_ov2640_qoi.decode(_encode(data, 1), 1)
+    assert (width, height) == (WIDTH, HEIGHT)
+    assert decoded == data
+
+
+def test_16_bit_view_matches_bytes() -> None:
+    # A 16-bit view, like that of a displayio.Bitmap, holds the same image as
+    # its bytes in memory, which are little endian
+    pixels = _image()
+    view = memoryview(pixels)
+    assert _encode(view, 1) == _encode(pixels.tobytes(), 1)
+
+    big = array("H", pixels)
+    big.byteswap()
+    assert _encode(memoryview(big), 0) == _encode(pixels.tobytes(), 1)
+
+
+def test_16_bit_view_rows() -> None:
+    output = io.BytesIO()
+    encoder = adafruit_ov2640_qoi.QOIEncoder(output, WIDTH, HEIGHT, 1)
+    view = memoryview(_image())
+    half = WIDTH * HEIGHT // 2
+    encoder.write_rows(view[:half], 0)
+    encoder.write_rows(view[half:], HEIGHT // 2)
+    encoder.close()
+    assert adafruit_ov2640_qoi.decode(output.getvalue(), 1)[2] == _image().tobytes()